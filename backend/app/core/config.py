@@ -17,6 +17,22 @@ class Settings(BaseSettings):
     # SendGrid Configuration (recommended for Render)
     sendgrid_api_key: Optional[str] = ""
     
+    # Connection pool (per worker process): keep
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres max_connections
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 5  # seconds to wait for a free connection before erroring
+    DB_POOL_RECYCLE: int = 3600  # seconds before a pooled connection is replaced
+    DB_QUERY_CACHE_SIZE: int = 1200  # compiled-statement cache entries (SQLAlchemy default 500)
+    # Set when DATABASE_URL points at PgBouncer (or Supabase's pooler) in transaction mode
+    DB_PGBOUNCER: bool = False
+    
+    # Redis Cache (optional - caching is skipped when empty)
+    REDIS_URL: Optional[str] = ""
+    
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    
     class Config:
         env_file = ".env"
 
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
+from uuid import uuid4
 import ssl
 
 # Create Async Engine
@@ -14,6 +15,16 @@ elif settings.DATABASE_URL.startswith("postgresql"):
     ssl_context.check_hostname = False
     ssl_context.verify_mode = ssl.CERT_NONE
     connect_args = {"ssl": ssl_context, "timeout": 30}
+    if settings.DB_PGBOUNCER:
+        # Transaction pooling can hand each transaction a different server
+        # connection, so asyncpg must not keep named prepared statements around,
+        # and the names it does use must be unique (the default __asyncpg_stmt_N__
+        # counter collides across server connections)
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__"
+        )
 
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -21,8 +32,11 @@ engine = create_async_engine(
     future=True,
     connect_args=connect_args,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # fail fast instead of queueing for 30s
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE
 )
 
 # Create Session Factory
@@ -1,4 +1,5 @@
-from typing import Annotated
+from typing import Annotated, NamedTuple
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
@@ -12,6 +13,33 @@ from app.schemas.user import TokenData
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
+class AuthSnapshot(NamedTuple):
+    """Immutable view of a token's user, enough for the admin role gates"""
+    id: str
+    email: str
+    role: UserRole
+
+
+# Short-lived in-process memo of role snapshots, keyed by the token itself
+# (tokens carry no jti), so admin role checks don't cost a SELECT per request.
+# The JWT is still decoded and verified on every call. get_current_user
+# always loads a fresh User; only get_current_admin/get_current_super_admin
+# read this cache.
+ROLE_CACHE_TTL = 30  # seconds
+_role_cache: TTLCache = TTLCache(maxsize=10_000, ttl=ROLE_CACHE_TTL)
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop a user's memoized role snapshots, e.g. after their role changes or they're deleted"""
+    for token, snapshot in list(_role_cache.items()):
+        if snapshot.id == user_id:
+            _role_cache.pop(token, None)
+
+
+def clear_auth_cache() -> None:
+    """Drop every memoized role snapshot, e.g. after users are deleted in bulk"""
+    _role_cache.clear()
+
 
 async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)], db: AsyncSession = Depends(get_db)):
     import traceback
@@ -71,7 +99,35 @@ async def get_current_user_optional(token: Annotated[str | None, Depends(oauth2_
     user = result.scalars().first()
     return user
 
-async def get_current_admin(current_user: Annotated[User, Depends(get_current_user)]):
+async def get_auth_snapshot(token: Annotated[str, Depends(oauth2_scheme)], db: AsyncSession = Depends(get_db)) -> AuthSnapshot:
+    """
+    Like get_current_user, but returns a memoized AuthSnapshot instead of a
+    live User, so repeat requests with the same token skip the DB.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        raise credentials_exception
+    email: str = payload.get("sub")
+    if email is None:
+        raise credentials_exception
+    
+    snapshot = _role_cache.get(token)
+    if snapshot is None:
+        row = (await db.execute(
+            select(User.id, User.email, User.role).where(User.email == email)
+        )).first()
+        if row is None:
+            raise credentials_exception
+        snapshot = _role_cache[token] = AuthSnapshot(*row)
+    return snapshot
+
+async def get_current_admin(current_user: Annotated[AuthSnapshot, Depends(get_auth_snapshot)]):
     if current_user.role not in [UserRole.ADMIN, UserRole.SUPER_ADMIN]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -79,7 +135,7 @@ async def get_current_admin(current_user: Annotated[User, Depends(get_current_us
         )
     return current_user
 
-async def get_current_super_admin(current_user: Annotated[User, Depends(get_current_user)]):
+async def get_current_super_admin(current_user: Annotated[AuthSnapshot, Depends(get_auth_snapshot)]):
     if current_user.role != UserRole.SUPER_ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
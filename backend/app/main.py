@@ -3,6 +3,7 @@ from fastapi import FastAPI, Depends, WebSocket, WebSocketDisconnect, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.logging_config import setup_logging
 from app.database import engine, Base
 # from app.database import engine, Base # Duplicate removed
 from app.routers import auth, reading_rooms, cabins, bookings, accommodations, waitlist, ads, ad_categories, locations, admin_cities, users, reviews, inquiries, trust, payments, reset, invoices, boost, cache, subscriptions, favorites, razorpay, otp, venue_payments, messages, notifications
@@ -11,6 +12,7 @@ from app.models.trust_flag import TrustFlag  # Ensure trust tables are created
 from app.models.reminder import Reminder
 from app.models.audit_log import AuditLog
 from app.models.invoice import Invoice  # Invoice model for PDF generation
+from app.services.audit_service import start_audit_flusher, stop_audit_flusher
 from app.middleware.security import (
     SecurityHeadersMiddleware,
     RateLimitMiddleware,
@@ -20,6 +22,8 @@ from app.middleware.security import (
 from typing import List
 import traceback
 
+setup_logging()
+
 app = FastAPI(title="StudySpace Manager API")
 
 # Security Middleware (Add before CORS)
@@ -74,6 +78,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset pagination on list endpoints
 )
 
 # Health check endpoint for Render
@@ -119,6 +124,9 @@ app.include_router(cache.router)  # Cache Management (Super Admin)
 async def startup():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+    # Background writer for queued audit log entries
+    start_audit_flusher()
     
     # Auto-create admin user if it doesn't exist
     from app.database import AsyncSessionLocal
@@ -152,6 +160,12 @@ async def startup():
         except Exception as e:
             print(f"⚠️  Could not create admin user: {e}")
 
+
+@app.on_event("shutdown")
+async def shutdown():
+    # Flush audit entries still waiting in the queue
+    await stop_audit_flusher()
+
 from app.core.socket_manager import manager
 
 @app.websocket("/ws/cabins")
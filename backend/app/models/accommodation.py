@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, Enum, Boolean
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, Enum, Boolean, Index
 from app.database import Base
 import enum
 
@@ -65,3 +65,7 @@ class Accommodation(Base):
             except:
                 return self.images
         return None
+
+
+# Owner dashboards and trust-flag ownership checks filter venues by owner
+Index('ix_accommodations_owner', Accommodation.owner_id)
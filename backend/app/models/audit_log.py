@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Enum, DateTime, Text
+from sqlalchemy import Column, String, Enum, DateTime, Text, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from app.database import Base
 import enum
 
@@ -66,8 +67,9 @@ class AuditLog(Base):
     entity_id = Column(String, nullable=True)
     entity_name = Column(String, nullable=True)
     
-    # Additional context (JSON serialized)
-    extra_data = Column(Text, nullable=True)  # JSON string with additional details
+    # Additional context - native JSONB on Postgres (plain JSON elsewhere), so
+    # dicts go in and come out as-is and metadata fields can be indexed
+    extra_data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     
     # Immutable timestamp
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -75,3 +77,8 @@ class AuditLog(Base):
     # IP and session info for security audits
     ip_address = Column(String, nullable=True)
     session_id = Column(String, nullable=True)
+
+
+# Newest-first log browsing and per-entity history
+Index('ix_audit_logs_timestamp', AuditLog.timestamp)
+Index('ix_audit_logs_entity', AuditLog.entity_type, AuditLog.entity_id, AuditLog.timestamp)
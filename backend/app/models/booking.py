@@ -1,5 +1,6 @@
 import uuid
-from sqlalchemy import Column, String, Float, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, String, Float, ForeignKey, DateTime, Enum, Index
+from sqlalchemy.orm import relationship
 from app.database import Base
 
 import enum
@@ -39,3 +40,21 @@ class Booking(Base):
     transaction_id = Column(String, nullable=True)
     settlement_status = Column(Enum(SettlementStatus), default=SettlementStatus.NOT_SETTLED)
 
+    cabin = relationship("Cabin")
+    accommodation = relationship("Accommodation")
+
+
+
+# Review eligibility: a user's confirmed bookings, earliest first
+Index('ix_bookings_user_status_start', Booking.user_id, Booking.status, Booking.start_date)
+
+# Same lookup restricted to confirmed bookings; matches the eligibility query's
+# status IN (ACTIVE, EXPIRED) predicate so the planner can use the smaller index
+CONFIRMED_BOOKING_STATUSES = (BookingStatus.ACTIVE, BookingStatus.EXPIRED)
+Index(
+    'ix_bookings_confirmed_user_start',
+    Booking.user_id,
+    Booking.start_date,
+    postgresql_where=Booking.status.in_(CONFIRMED_BOOKING_STATUSES),
+    sqlite_where=Booking.status.in_(CONFIRMED_BOOKING_STATUSES)
+)
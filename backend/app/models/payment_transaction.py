@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Float, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, String, Float, ForeignKey, DateTime, Enum, Index
 from app.database import Base
 
 import enum
@@ -58,3 +58,7 @@ class PaymentTransaction(Base):
     # Timestamp
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+
+# Serve "latest payment for user" and per-booking history without a sort
+Index('ix_pt_user_created', PaymentTransaction.user_id, PaymentTransaction.created_at.desc())
+Index('ix_pt_booking_created', PaymentTransaction.booking_id, PaymentTransaction.created_at.desc())
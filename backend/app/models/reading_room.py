@@ -1,8 +1,9 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, Boolean, Enum, ARRAY, DateTime
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, Boolean, Enum, ARRAY, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.types import CommaSeparatedList, JSONEncodedList
 import enum
 
 class CabinStatus(str, enum.Enum):
@@ -31,10 +32,10 @@ class ReadingRoom(Base):
     name = Column(String, nullable=False)
     address = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    # Changed from single image_url to images (JSON string of list)
-    images = Column(String, nullable=True) 
+    # Changed from single image_url to images (list, stored as JSON string)
+    images = Column(JSONEncodedList, nullable=True) 
     # Backward compatibility accessor if needed, or simply remove image_url and migrate
-    amenities = Column(String, nullable=True) 
+    amenities = Column(CommaSeparatedList, nullable=True) 
     contact_phone = Column(String, nullable=True)
     price_start = Column(Float, nullable=True)
     
@@ -63,7 +64,7 @@ class ReadingRoom(Base):
     # Payment & Subscription tracking
     subscription_plan_id = Column(String, ForeignKey("subscription_plans.id"), nullable=True)
     payment_id = Column(String, nullable=True)  # Razorpay payment ID
-    payment_date = Column(DateTime, nullable=True)
+    payment_date = Column(DateTime(timezone=True), nullable=True)
     
     # Submission timestamp
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -73,14 +74,7 @@ class ReadingRoom(Base):
     @property
     def image_url(self):
         # Fallback for frontend that expects single image_url
-        if self.images:
-            try:
-                import json
-                imgs = json.loads(self.images)
-                return imgs[0] if imgs else None
-            except:
-                return self.images # Fallback if stored as raw string previously
-        return None
+        return self.images[0] if self.images else None
 
 class Cabin(Base):
     __tablename__ = "cabins"
@@ -89,7 +83,7 @@ class Cabin(Base):
     reading_room_id = Column(String, ForeignKey("reading_rooms.id"), nullable=False)
     number = Column(String, nullable=False)
     floor = Column(Integer, nullable=False)
-    amenities = Column(String, nullable=True)
+    amenities = Column(CommaSeparatedList, nullable=True)
     price = Column(Float, nullable=False)
     status = Column(Enum(CabinStatus), default=CabinStatus.AVAILABLE)
     current_occupant_id = Column(String, ForeignKey("users.id"), nullable=True)
@@ -119,3 +113,10 @@ class Cabin(Base):
         """Check if cabin is held by specific user"""
         return self.is_held() and self.held_by_user_id == user_id
 
+
+
+# Cabins are almost always looked up / joined by their venue
+Index('ix_cabins_reading_room', Cabin.reading_room_id)
+
+# Owner dashboards and trust-flag ownership checks filter venues by owner
+Index('ix_reading_rooms_owner', ReadingRoom.owner_id)
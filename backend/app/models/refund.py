@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Float, ForeignKey, DateTime, Enum, Text
+from sqlalchemy import Column, String, Float, ForeignKey, DateTime, Enum, Text, Index, func
 from app.database import Base
 
 import enum
@@ -31,12 +31,12 @@ class Refund(Base):
     booking_id = Column(String, ForeignKey("bookings.id"), nullable=False)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     amount = Column(Float, nullable=False)
-    reason = Column(Enum(RefundReason), default=RefundReason.OTHER)
+    reason = Column(Enum(RefundReason), default=RefundReason.OTHER, server_default=RefundReason.OTHER.value, nullable=False)
     reason_text = Column(Text, nullable=True)  # User's description
-    status = Column(Enum(RefundStatus), default=RefundStatus.REQUESTED)
+    status = Column(Enum(RefundStatus), default=RefundStatus.REQUESTED, server_default=RefundStatus.REQUESTED.value, nullable=False)
     
     # Timestamps
-    requested_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    requested_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False)
     reviewed_at = Column(DateTime, nullable=True)
     processed_at = Column(DateTime, nullable=True)
     
@@ -46,3 +46,7 @@ class Refund(Base):
     
     # Gateway info (for processed refunds)
     gateway_ref = Column(String, nullable=True)  # Razorpay/Stripe refund ID
+
+
+# Serve a user's refund list newest-first without a sort
+Index('ix_refund_user_requested', Refund.user_id, Refund.requested_at.desc())
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Enum, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, Enum, DateTime, Text, ForeignKey, Boolean, Index
 from app.database import Base
 import enum
 
@@ -60,3 +60,17 @@ class Reminder(Base):
     # Email notification tracking
     email_sent = Column(Boolean, default=False)
     email_sent_at = Column(DateTime, nullable=True)
+
+
+# One pending reminder per (user, type)
+Index(
+    'uq_reminders_pending_user_type',
+    Reminder.user_id,
+    Reminder.reminder_type,
+    unique=True,
+    postgresql_where=Reminder.status == ReminderStatus.PENDING,
+    sqlite_where=Reminder.status == ReminderStatus.PENDING
+)
+
+# A user's reminders by status (block checks, pending lookups)
+Index('ix_reminders_user_status', Reminder.user_id, Reminder.status)
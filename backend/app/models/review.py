@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Index
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime
@@ -9,6 +9,9 @@ class Review(Base):
     __table_args__ = (
         Index('ix_unique_review_reading_room', 'user_id', 'reading_room_id', unique=True, sqlite_where=Column("reading_room_id").isnot(None)),
         Index('ix_unique_review_accommodation', 'user_id', 'accommodation_id', unique=True, sqlite_where=Column("accommodation_id").isnot(None)),
+        # Public venue review listings: filter on the venue, keyset-paged newest first
+        Index('ix_reviews_reading_room_created', 'reading_room_id', 'created_at', 'id'),
+        Index('ix_reviews_accommodation_created', 'accommodation_id', 'created_at', 'id'),
         {'extend_existing': True}
     )
 
@@ -19,6 +22,7 @@ class Review(Base):
     rating = Column(Integer, nullable=False)
     comment = Column(String, nullable=True)
     # date column removed - using created_at
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # NOT NULL: (created_at, id) is the keyset cursor for review listings
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False)
 
     # user = relationship("User")
@@ -3,7 +3,7 @@ SubscriptionPlan Model - Venue listing subscription plans created by Super Admin
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Float, Integer, DateTime, Text, Boolean, JSON
+from sqlalchemy import Column, String, Float, Integer, DateTime, Text, Boolean, JSON, Index, true
 from app.database import Base
 
 
@@ -25,3 +25,12 @@ class SubscriptionPlan(Base):
     created_by = Column(String, nullable=False)  # Super Admin ID
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+# Active plan listing, ordered by price
+Index(
+    'ix_subplans_active_price',
+    SubscriptionPlan.price,
+    postgresql_where=SubscriptionPlan.is_active == true(),
+    sqlite_where=SubscriptionPlan.is_active == true()
+)
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Enum, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Enum, DateTime, Text, ForeignKey, Index
 from app.database import Base
 import enum
 
@@ -59,3 +59,18 @@ class TrustFlag(Base):
     # Owner resubmission
     owner_notes = Column(Text, nullable=True)  # Notes from owner when resubmitting
     resubmitted_at = Column(DateTime, nullable=True)
+
+
+# Flags still awaiting an outcome; at most one per entity (enforced by the index)
+OPEN_FLAG_STATUSES = (TrustFlagStatus.ACTIVE, TrustFlagStatus.OWNER_RESUBMITTED)
+Index(
+    'uq_trust_flags_open_entity',
+    TrustFlag.entity_id,
+    unique=True,
+    postgresql_where=TrustFlag.status.in_(OPEN_FLAG_STATUSES),
+    sqlite_where=TrustFlag.status.in_(OPEN_FLAG_STATUSES)
+)
+
+# Per-entity flag lookups and status-filtered, newest-first admin listings
+Index('ix_trust_flags_entity_status', TrustFlag.entity_id, TrustFlag.status)
+Index('ix_trust_flags_status_created', TrustFlag.status, TrustFlag.created_at)
@@ -0,0 +1,60 @@
+import orjson
+
+from sqlalchemy import String
+from sqlalchemy.types import TypeDecorator
+
+
+class JSONEncodedList(TypeDecorator):
+    """
+    List stored as a JSON string in a plain String column.
+    Parsed once on load, so attribute access gives a native list.
+    Legacy rows holding a bare string (single image URL) load as a one-item list.
+    """
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return orjson.dumps(list(value)).decode()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if not value.strip():
+            return []
+        try:
+            parsed = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return [value]
+        if isinstance(parsed, list):
+            return parsed
+        return [parsed] if parsed else []
+
+
+class CommaSeparatedList(TypeDecorator):
+    """
+    List stored as a comma-separated string in a plain String column.
+    Items are trimmed on write and parsed once on load, so attribute access gives
+    a native list. Legacy rows holding a JSON array load as that list.
+    """
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or (isinstance(value, str) and value.startswith("[")):
+            return value
+        items = value.split(",") if isinstance(value, str) else value
+        return ",".join(item.strip() for item in items if item and item.strip())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if value.startswith("["):
+            try:
+                parsed = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, list):
+                return parsed
+        return [item.strip() for item in value.split(",") if item.strip()]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Enum, Boolean
+from sqlalchemy import Column, String, ForeignKey, DateTime, Enum, Boolean, Index
 from app.database import Base
 from datetime import datetime
 import uuid
@@ -11,6 +11,10 @@ class WaitlistStatus(str, enum.Enum):
     CANCELLED = "CANCELLED"
     CONVERTED = "CONVERTED"
 
+# Entries still holding a place in the queue; one module-level tuple so every
+# status IN (...) filter binds the same value and hits the compiled-statement cache
+OPEN_WAITLIST_STATUSES = (WaitlistStatus.ACTIVE, WaitlistStatus.NOTIFIED)
+
 class WaitlistEntry(Base):
     __tablename__ = "waitlist"
 
@@ -27,6 +31,14 @@ class WaitlistEntry(Base):
     expires_at = Column(DateTime, nullable=True) # When the reservation window ends
 
 
+# FIFO queue per cabin (next-in-line lookup, queue-position rank)
+Index('ix_waitlist_cabin_status_created', WaitlistEntry.cabin_id, WaitlistEntry.status, WaitlistEntry.created_at)
+# A user's own entries: duplicate-join check, my-waitlists, has_active_waitlist
+Index('ix_waitlist_user_cabin_status', WaitlistEntry.user_id, WaitlistEntry.cabin_id, WaitlistEntry.status)
+# Owner view of a venue's queue
+Index('ix_waitlist_rr_status_created', WaitlistEntry.reading_room_id, WaitlistEntry.status, WaitlistEntry.created_at)
+
+
 class Notification(Base):
     __tablename__ = "notifications"
 
@@ -9,7 +9,8 @@ from app.models.reading_room import ListingStatus
 from app.models.booking import Booking
 from app.schemas.accommodation import AccommodationResponse, AccommodationCreate, AccommodationUpdate
 from app.models.user import User, UserRole
-from app.deps import get_current_admin, get_current_user_optional, get_current_user
+from app.deps import AuthSnapshot, get_current_admin, get_current_user_optional, get_current_user
+from app.utils.venue_cache import invalidate_venue_name
 
 router = APIRouter(prefix="/accommodations", tags=["accommodations"])
 
@@ -99,7 +100,7 @@ async def get_my_accommodations(
 async def create_accommodation(
     accommodation: AccommodationCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     new_acc = Accommodation(
         **accommodation.model_dump(),
@@ -137,7 +138,7 @@ async def update_accommodation(
     acc_id: str,
     updates: AccommodationUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     result = await db.execute(select(Accommodation).where(Accommodation.id == acc_id))
     acc = result.scalars().first()
@@ -158,6 +159,7 @@ async def update_accommodation(
         setattr(acc, key, value)
     
     await db.commit()
+    invalidate_venue_name("accommodation", acc_id)
     await db.refresh(acc)
     return acc
 
@@ -166,7 +168,7 @@ async def update_accommodation(
 async def delete_accommodation(
     acc_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     """Delete an accommodation. Only owner can delete. Cannot delete if there are any bookings."""
     result = await db.execute(select(Accommodation).where(Accommodation.id == acc_id))
@@ -190,6 +192,7 @@ async def delete_accommodation(
     
     await db.delete(acc)
     await db.commit()
+    invalidate_venue_name("accommodation", acc_id)
     
     return {"message": "Accommodation deleted successfully"}
 
@@ -198,7 +201,7 @@ async def delete_accommodation(
 async def submit_accommodation_payment(
     acc_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     result = await db.execute(select(Accommodation).where(Accommodation.id == acc_id))
     acc = result.scalars().first()
@@ -253,7 +256,7 @@ async def submit_accommodation_payment(
 async def verify_accommodation(
     acc_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     result = await db.execute(select(Accommodation).where(Accommodation.id == acc_id))
     acc = result.scalars().first()
@@ -274,7 +277,7 @@ async def reject_accommodation(
     acc_id: str,
     rejection: RejectRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     result = await db.execute(select(Accommodation).where(Accommodation.id == acc_id))
     acc = result.scalars().first()
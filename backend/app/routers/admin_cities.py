@@ -9,16 +9,16 @@ from app.models.reading_room import ReadingRoom, Cabin, CabinStatus
 from app.models.accommodation import Accommodation
 from app.models.booking import Booking
 from app.models.city import CitySettings
-from app.models.user import User
 from app.schemas.city import CityStats, CityUpdate, CityDetail, AreaStats
-from app.deps import get_current_admin
+from app.deps import AuthSnapshot, get_current_admin
+from app.utils import city_cache
 
 router = APIRouter(prefix="/admin/cities", tags=["admin-cities"])
 
 @router.get("/", response_model=List[CityStats])
 async def get_all_cities(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     # 1. Fetch Settings
     settings_result = await db.execute(select(CitySettings))
@@ -108,7 +108,7 @@ async def update_city_status(
     city_name: str,
     update: CityUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     # Upsert setting
     normalized_name = city_name.strip().title() # Key storage format? 
@@ -127,6 +127,7 @@ async def update_city_status(
         setting.is_active = update.is_active
     
     await db.commit()
+    city_cache.invalidate()
     await db.refresh(setting)
 
     # Return stats (reuse aggregation or minimal return?)
@@ -149,7 +150,7 @@ async def update_city_status(
 async def get_city_details(
     city_name: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     target_city = city_name.strip().title()
     
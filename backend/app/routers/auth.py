@@ -138,7 +138,7 @@ async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db:
     # Check waitlist status
     wl_result = await db.execute(select(WaitlistEntry).where(
         WaitlistEntry.user_id == user.id,
-        WaitlistEntry.status.in_([WaitlistStatus.ACTIVE, WaitlistStatus.NOTIFIED])
+        WaitlistEntry.status.in_(OPEN_WAITLIST_STATUSES)
     ))
     has_active = wl_result.scalars().first() is not None
 
@@ -153,7 +153,7 @@ async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db:
         "has_active_waitlist": has_active
     }
 
-from app.models.waitlist import WaitlistEntry, WaitlistStatus
+from app.models.waitlist import WaitlistEntry, OPEN_WAITLIST_STATUSES
 
 @router.get("/me", response_model=UserResponse)
 async def read_users_me(
@@ -163,7 +163,7 @@ async def read_users_me(
     # Check for active waitlist entries
     query = select(WaitlistEntry).where(
         WaitlistEntry.user_id == current_user.id,
-        WaitlistEntry.status.in_([WaitlistStatus.ACTIVE, WaitlistStatus.NOTIFIED])
+        WaitlistEntry.status.in_(OPEN_WAITLIST_STATUSES)
     )
     result = await db.execute(query)
     has_active = result.scalars().first() is not None
@@ -206,12 +206,12 @@ async def create_booking(
         
         # Check and update Waitlist status to CONVERTED
         try:
-            from app.models.waitlist import WaitlistEntry, WaitlistStatus
+            from app.models.waitlist import WaitlistEntry, WaitlistStatus, OPEN_WAITLIST_STATUSES
             wl_result = await db.execute(
                 select(WaitlistEntry).where(
                     WaitlistEntry.user_id == current_user.id,
                     WaitlistEntry.reading_room_id == cabin.reading_room_id,
-                    WaitlistEntry.status.in_([WaitlistStatus.ACTIVE, WaitlistStatus.NOTIFIED])
+                    WaitlistEntry.status.in_(OPEN_WAITLIST_STATUSES)
                 )
             )
             wl_entry = wl_result.scalars().first()
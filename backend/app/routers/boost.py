@@ -13,7 +13,7 @@ from app.models.boost_request import BoostRequest, BoostRequestStatus, VenueType
 from app.models.user import User, UserRole
 from app.models.reading_room import ReadingRoom
 from app.models.accommodation import Accommodation
-from app.deps import get_current_user, get_current_admin, get_current_user_optional
+from app.deps import AuthSnapshot, get_current_user, get_current_admin, get_current_user_optional
 
 
 router = APIRouter(prefix="/boost", tags=["boost"])
@@ -119,7 +119,7 @@ async def get_boost_plans(
 async def create_boost_plan(
     plan: BoostPlanCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     """Create a new boost plan. Super Admin only."""
     print(f"DEBUG: create_boost_plan called by {current_user.email} with role {current_user.role}")
@@ -150,7 +150,7 @@ async def update_boost_plan(
     plan_id: str,
     updates: BoostPlanUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     """Update a boost plan. Super Admin only."""
     if current_user.role != UserRole.SUPER_ADMIN:
@@ -175,7 +175,7 @@ async def update_boost_plan(
 async def delete_boost_plan(
     plan_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     """Delete a boost plan. Super Admin only."""
     if current_user.role != UserRole.SUPER_ADMIN:
@@ -405,7 +405,7 @@ async def mark_request_paid(
 async def get_all_boost_requests(
     status_filter: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     """Get all boost requests. Super Admin only."""
     if current_user.role != UserRole.SUPER_ADMIN:
@@ -455,7 +455,7 @@ async def approve_boost_request(
     request_id: str,
     approval: ApprovalRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     """Approve a boost request. Super Admin only."""
     if current_user.role != UserRole.SUPER_ADMIN:
@@ -495,7 +495,7 @@ async def reject_boost_request(
     request_id: str,
     rejection: RejectionRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     """Reject a boost request. Super Admin only."""
     if current_user.role != UserRole.SUPER_ADMIN:
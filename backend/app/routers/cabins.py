@@ -6,7 +6,7 @@ from app.database import get_db
 from app.models.reading_room import Cabin, CabinStatus
 from app.schemas.reading_room import CabinResponse, CabinUpdate
 from app.models.user import User
-from app.deps import get_current_user, get_current_admin
+from app.deps import AuthSnapshot, get_current_user, get_current_admin
 from pydantic import BaseModel
 from datetime import datetime, timedelta, timezone
 
@@ -40,7 +40,7 @@ class BulkUpdateSchema(BaseModel):
 async def bulk_update_cabins(
     payload: BulkUpdateSchema,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     # Fetch cabins
     query = select(Cabin).where(Cabin.id.in_(payload.cabin_ids))
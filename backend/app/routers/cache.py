@@ -9,7 +9,6 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import List, Optional
-import json
 
 from app.database import get_db
 from app.models.audit_log import AuditLog, AuditActionType
@@ -35,7 +34,7 @@ CACHE_SCOPES = {
     "plans": ["plans:boost", "plans:active", "promotions:*"],
     "ads": ["ads:campaigns", "ads:banners", "featured:listings"],
     "trust": ["trust:flags", "trust:cases", "trust:reminders"],
-    "payments": ["payments:history", "payments:pending", "transactions:*"]
+    "payments": ["payments:history", "payments:pending", "transactions:*", "user:*:last_payment"]
 }
 
 
@@ -105,11 +104,11 @@ async def clear_cache(
         entity_type="system",
         entity_id="cache",
         entity_name="System Cache",
-        extra_data=json.dumps({
+        extra_data={
             "scopes": scopes_to_clear,
             "keys_count": cleared_count,
             "timestamp": datetime.utcnow().isoformat()
-        }),
+        },
         timestamp=datetime.utcnow(),
         ip_address=client_ip
     )
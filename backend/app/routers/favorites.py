@@ -90,7 +90,7 @@ async def add_favorite(
         if room:
             item_name = room.name
             item_type = "reading_room"
-            item_image = room.images.strip('"[]').split('","')[0] if room.images else None
+            item_image = room.images[0] if room.images else None
             item_price = room.price_start
             item_city = room.city
     
@@ -139,7 +139,7 @@ async def get_favorites(
             if room:
                 item_name = room.name
                 item_type = "reading_room"
-                item_image = room.images.strip('"[]').split('","')[0] if room.images else None
+                item_image = room.images[0] if room.images else None
                 item_price = room.price_start
                 item_city = room.city
         
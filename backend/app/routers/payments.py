@@ -8,23 +8,32 @@ Handles:
 - PATCH /admin/refunds/{id} - Update refund status (Super Admin)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-from pydantic import BaseModel
-from typing import Optional, List
+from sqlalchemy import select, insert, desc, func, tuple_
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from typing import Annotated, Optional, List, Dict, Set, Tuple
 from datetime import datetime
+import asyncio
+import time
+import orjson
 
 from app.database import get_db
 from app.deps import get_current_user
 from app.models.user import User, UserRole
 from app.models.booking import Booking
 from app.models.refund import Refund, RefundStatus, RefundReason
-from app.models.payment_transaction import PaymentTransaction, PaymentMethod, PaymentGateway
+from app.models.payment_transaction import PaymentTransaction, PaymentMethod, PaymentGateway, PaymentType
 from app.models.reading_room import ReadingRoom, Cabin
 from app.models.accommodation import Accommodation
+from app.services.cache_service import cache_service
+from app.services.payment_service import payment_service
+from app.utils.pagination import decode_cursor, next_cursor
 
-router = APIRouter(prefix="/payments", tags=["Payments & Refunds"])
+# orjson serializes the large history/refund lists much faster than the stdlib encoder
+router = APIRouter(prefix="/payments", tags=["Payments & Refunds"], default_response_class=ORJSONResponse)
 
 # Initialize Razorpay Client
 import razorpay
@@ -40,18 +49,128 @@ razorpay_client = razorpay.Client(
     )
 )
 
+# Payment IDs issued by the mock checkout flow
+_MOCK_PAYMENT_PREFIX = "pay_mock_"
+
+# Last-used payment only changes when the user pays, so cache it briefly
+LAST_PAYMENT_CACHE_TTL = 300  # seconds
+
+
+def last_payment_cache_key(user_id: str) -> str:
+    return f"user:{user_id}:last_payment"
+
+
+UNKNOWN_VENUE = ("Unknown Venue", None)
+
+# History/refund pages
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Enum -> value lookups for the serialization loops; a single dict hit also
+# covers NULL columns via the .get() default
+_METHOD_VALUES = {m: m.value for m in PaymentMethod}
+_GATEWAY_VALUES = {g: g.value for g in PaymentGateway}
+_PAYMENT_TYPE_VALUES = {t: t.value for t in PaymentType}
+_REFUND_STATUS_VALUES = {s: s.value for s in RefundStatus}
+_REFUND_REASON_VALUES = {r: r.value for r in RefundReason}
+
+
+async def resolve_venue_names(db: AsyncSession, booking_ids: Set[str]) -> Dict[str, Tuple[str, Optional[str]]]:
+    """
+    Resolve {booking_id: (venue_name, cabin_number)} for a set of bookings.
+    Issues two IN-queries (cabin bookings, accommodation bookings) instead of
+    walking booking -> cabin -> room for every row.
+    """
+    venues: Dict[str, Tuple[str, Optional[str]]] = {}
+    if not booking_ids:
+        return venues
+    
+    cabin_rows = await db.execute(
+        select(Booking.id, ReadingRoom.name, Cabin.number)
+        .join(Cabin, Cabin.id == Booking.cabin_id)
+        .outerjoin(ReadingRoom, ReadingRoom.id == Cabin.reading_room_id)
+        .where(Booking.id.in_(booking_ids))
+    )
+    for booking_id, room_name, cabin_number in cabin_rows:
+        venues[booking_id] = (room_name or UNKNOWN_VENUE[0], cabin_number)
+    
+    acc_rows = await db.execute(
+        select(Booking.id, Accommodation.name)
+        .join(Accommodation, Accommodation.id == Booking.accommodation_id)
+        .where(Booking.id.in_(booking_ids), Booking.cabin_id.is_(None))
+    )
+    for booking_id, acc_name in acc_rows:
+        venues[booking_id] = (acc_name, None)
+    
+    return venues
+
+
+def _cursor_headers(cursor_out: Optional[str]) -> Optional[Dict[str, str]]:
+    """X-Next-Cursor header for a keyset-paginated list (omitted on the last page)"""
+    return {"X-Next-Cursor": cursor_out} if cursor_out else None
+
+
+async def _payment_totals(db: AsyncSession, stmt) -> Tuple[int, float]:
+    """
+    (count, sum of amount) over every payment matched by stmt, not just the
+    returned page. stmt is a select(PaymentTransaction) carrying the filters.
+    """
+    totals = stmt.with_only_columns(
+        func.count(PaymentTransaction.id),
+        func.coalesce(func.sum(PaymentTransaction.amount), 0)
+    )
+    total_count, total_amount = (await db.execute(totals)).one()
+    return total_count, float(total_amount)
+
+
+def _empty_payment_history() -> ORJSONResponse:
+    return ORJSONResponse({"payments": [], "total_count": 0, "total_amount": 0})
+
+
+async def _stream_payment_page(payments: list, build_entry, total_count: int, total_amount: float):
+    """
+    Stream a payment-history page as JSON, one orjson-encoded entry at a time,
+    so the full list is never held in memory twice (dicts + encoded body).
+    Body shape: {"payments": [...], "total_count", "total_amount"}
+    """
+    yield b'{"payments":['
+    for i, payment in enumerate(payments):
+        entry = orjson.dumps(build_entry(payment))
+        yield b"," + entry if i else entry
+    # Reuse orjson for the trailer, dropping its opening brace
+    yield b"]," + orjson.dumps({
+        "total_count": total_count,
+        "total_amount": total_amount
+    })[1:]
+
 
 # ============================================
 # PYDANTIC SCHEMAS
 # ============================================
 
+# Inbound request bodies are read-only: no whitespace stripping, no
+# assignment validation, unknown keys dropped
+INBOUND_MODEL_CONFIG = ConfigDict(
+    extra='ignore',
+    str_strip_whitespace=False,
+    validate_assignment=False,
+    frozen=True
+)
+
+# Bounded amount so validation is a single range check (INR)
+Amount = Annotated[float, Field(gt=0, lt=1e7)]
+
 class OrderCreate(BaseModel):
-    amount: float # In INR
+    model_config = INBOUND_MODEL_CONFIG
+    
+    amount: Amount # In INR
     currency: str = "INR"
     receipt: Optional[str] = None
     notes: Optional[dict] = None
 
 class PaymentVerify(BaseModel):
+    model_config = INBOUND_MODEL_CONFIG
+    
     razorpay_order_id: str
     razorpay_payment_id: str
     razorpay_signature: str
@@ -79,6 +198,8 @@ class RefundOut(BaseModel):
     processed_at: Optional[str] = None
 
 class RefundRequestIn(BaseModel):
+    model_config = INBOUND_MODEL_CONFIG
+    
     booking_id: str
     reason: str  # RefundReason enum value
     reason_text: Optional[str] = None
@@ -91,6 +212,8 @@ class RefundAdminOut(RefundOut):
     reviewed_by: Optional[str] = None
 
 class RefundUpdateIn(BaseModel):
+    model_config = INBOUND_MODEL_CONFIG
+    
     status: str  # RefundStatus enum value
     admin_notes: Optional[str] = None
 
@@ -109,14 +232,12 @@ async def create_payment_order(
     Create a Razorpay Order. 
     If Razorpay keys are not configured, returns a DEMO order.
     """
-    from app.services.payment_service import payment_service
-    
     # Use payment service which handles demo mode automatically
     try:
         order = payment_service.create_order(
             amount=data.amount,
             currency=data.currency,
-            receipt=data.receipt or f"rcpt_{int(datetime.utcnow().timestamp())}",
+            receipt=data.receipt or f"rcpt_{int(time.time())}",
             notes={
                 "user_id": current_user.id,
                 "user_email": current_user.email,
@@ -136,16 +257,25 @@ async def create_payment_order(
         print(f"Payment Order Error: {e}")
         # Last fallback - return demo order even on exception
         return {
-            "id": f"order_error_{int(datetime.utcnow().timestamp())}",
+            "id": f"order_error_{int(time.time())}",
             "amount": int(data.amount * 100),
             "currency": data.currency,
             "key_id": "demo_key_id",
             "is_demo": True
         }
 
-@router.post("/verify")
+@router.post(
+    "/verify",
+    # Body is parsed manually below; keep it documented in OpenAPI
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": PaymentVerify.model_json_schema()}},
+            "required": True
+        }
+    }
+)
 async def verify_payment(
-    data: PaymentVerify,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -153,7 +283,12 @@ async def verify_payment(
     Verify Razorpay Payment Signature.
     Supports DEMO mode for testing.
     """
-    from app.services.payment_service import payment_service
+    # Single-pass parse+validate of the raw body (pydantic-core/jiter),
+    # skipping FastAPI's json.loads -> dict -> model_validate
+    try:
+        data = PaymentVerify.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
     
     try:
         # Use payment service which handles demo mode automatically
@@ -171,14 +306,14 @@ async def verify_payment(
         
         # 2. If booking_id is provided, update booking status
         if data.booking_id:
-            result = await db.execute(
-                select(Booking).where(Booking.id == data.booking_id)
-            )
-            booking = result.scalar_one_or_none()
+            booking = await db.get(Booking, data.booking_id)
             
             if booking:
                 # Update logic here if needed, or rely on separate service
                 pass 
+        
+        # New payment means the cached last-used method is stale
+        await cache_service.delete(last_payment_cache_key(current_user.id))
                 
         return {"status": "success", "message": "Payment verified successfully"}
 
@@ -197,11 +332,13 @@ async def verify_payment(
 # ============================================
 
 class SubscriptionConfirm(BaseModel):
+    model_config = INBOUND_MODEL_CONFIG
+    
     venue_id: str
     venue_type: str
     subscription_plan_id: str
     payment_id: str
-    amount: float
+    amount: Amount
 
 @router.post("/venue/confirm-subscription")
 async def confirm_venue_subscription(
@@ -215,10 +352,11 @@ async def confirm_venue_subscription(
     try:
         # 1. Fetch Payment Details from Razorpay to verify amount/status
         # Handle Mock Mode
-        is_mock = data.payment_id.startswith("pay_mock_")
+        is_mock = data.payment_id.startswith(_MOCK_PAYMENT_PREFIX)
         
         if not is_mock:
-            payment = razorpay_client.payment.fetch(data.payment_id)
+            # razorpay's client is synchronous HTTP - keep it off the event loop
+            payment = await asyncio.to_thread(razorpay_client.payment.fetch, data.payment_id)
             if payment['status'] != 'captured':
                  # Try to capture if authorized? Usually auto-captured.
                  pass
@@ -245,13 +383,13 @@ async def confirm_venue_subscription(
         # We need to find the venue and status update.
         
         if data.venue_type == 'reading_room':
-            result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == data.venue_id))
-            venue = result.scalar_one_or_none()
+            venue = await db.get(ReadingRoom, data.venue_id)
             if venue:
                 venue.status = "VERIFICATION_PENDING" # Or ACTIVE depending on workflow
                 # venue.subscription_expiry = ... 
         
         await db.commit()
+        await cache_service.delete(last_payment_cache_key(current_user.id))
         
         return {"status": "success", "message": "Subscription confirmed"}
 
@@ -273,6 +411,14 @@ async def get_payment_modes(
     supported_methods = ["UPI", "CARD", "NET_BANKING"]
     
     last_used = None
+    cache_key = last_payment_cache_key(current_user.id)
+    
+    cached = await cache_service.get(cache_key)
+    if cached:
+        return PaymentModesResponse(
+            supported_methods=supported_methods,
+            last_used=LastUsedPayment.model_validate_json(cached)
+        )
     
     # Get last used payment (wrapped in try-except for robustness)
     try:
@@ -285,12 +431,13 @@ async def get_payment_modes(
         last_payment = result.scalar_one_or_none()
         
         if last_payment:
-            last_used = LastUsedPayment(
-                method=last_payment.method.value if last_payment.method else "UPI",
-                gateway=last_payment.gateway.value if last_payment.gateway else "RAZORPAY",
+            last_used = LastUsedPayment.model_construct(
+                method=_METHOD_VALUES.get(last_payment.method, "UPI"),
+                gateway=_GATEWAY_VALUES.get(last_payment.gateway, "RAZORPAY"),
                 reference=last_payment.masked_reference,
                 date=last_payment.created_at.isoformat() if last_payment.created_at else datetime.utcnow().isoformat()
             )
+            await cache_service.set(cache_key, last_used.model_dump_json(), ttl=LAST_PAYMENT_CACHE_TTL)
     except Exception as e:
         # Log the error but continue - supported methods can still be returned
         print(f"Warning: Could not fetch last payment: {e}")
@@ -304,67 +451,51 @@ async def get_payment_modes(
 @router.get("/user/payment-history")
 async def get_payment_history(
     booking_id: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all payment transactions for the current user.
-    Returns ALL payments including initial bookings and extensions.
-    Optionally filter by booking_id.
+    Get payment transactions for the current user, newest first.
+    Includes initial bookings and extensions. Optionally filter by booking_id.
+    Keyset-paginated: the next page's cursor is returned in the X-Next-Cursor
+    header; totals cover every matching payment, not just the page.
     """
     query = select(PaymentTransaction).where(
         PaymentTransaction.user_id == current_user.id
-    ).order_by(desc(PaymentTransaction.created_at))
+    )
     
     if booking_id:
         query = query.where(PaymentTransaction.booking_id == booking_id)
     
-    result = await db.execute(query)
-    payments = result.scalars().all()
+    total_count, total_amount = await _payment_totals(db, query)
     
-    payment_list = []
-    for payment in payments:
-        # Get booking info for venue name
-        booking_result = await db.execute(
-            select(Booking).where(Booking.id == payment.booking_id)
+    query = query.order_by(desc(PaymentTransaction.created_at), desc(PaymentTransaction.id))
+    if cursor:
+        query = query.where(
+            tuple_(PaymentTransaction.created_at, PaymentTransaction.id) < decode_cursor(cursor)
         )
-        booking = booking_result.scalar_one_or_none()
-        
-        venue_name = "Unknown Venue"
-        cabin_number = None
-        if booking and booking.cabin_id:
-            cabin_result = await db.execute(
-                select(Cabin).where(Cabin.id == booking.cabin_id)
-            )
-            cabin = cabin_result.scalar_one_or_none()
-            if cabin:
-                cabin_number = cabin.number
-                room_result = await db.execute(
-                    select(ReadingRoom).where(ReadingRoom.id == cabin.reading_room_id)
-                )
-                room = room_result.scalar_one_or_none()
-                if room:
-                    venue_name = room.name
-        elif booking and booking.accommodation_id:
-            acc_result = await db.execute(
-                select(Accommodation).where(Accommodation.id == booking.accommodation_id)
-            )
-            acc = acc_result.scalar_one_or_none()
-            if acc:
-                venue_name = acc.name
+    
+    result = await db.execute(query.limit(limit + 1))
+    payments = result.scalars().all()
+    cursor_out = next_cursor(payments, limit)
+    
+    venues = await resolve_venue_names(db, {p.booking_id for p in payments})
+    
+    def build_entry(payment: PaymentTransaction) -> dict:
+        venue_name, cabin_number = venues.get(payment.booking_id, UNKNOWN_VENUE)
         
-        # Get payment type - handle both old records (without type) and new ones
-        payment_type = "INITIAL"
-        if hasattr(payment, 'payment_type') and payment.payment_type:
-            payment_type = payment.payment_type.value if hasattr(payment.payment_type, 'value') else str(payment.payment_type)
+        # Get payment type - old records without a type count as INITIAL
+        payment_type = _PAYMENT_TYPE_VALUES.get(payment.payment_type, "INITIAL")
         
-        payment_list.append({
+        return {
             "id": payment.id,
             "booking_id": payment.booking_id,
             "type": payment_type,
             "amount": payment.amount,
-            "method": payment.method.value if payment.method else "UPI",
-            "gateway": payment.gateway.value if payment.gateway else "RAZORPAY",
+            "method": _METHOD_VALUES.get(payment.method, "UPI"),
+            "gateway": _GATEWAY_VALUES.get(payment.gateway, "RAZORPAY"),
             "transaction_id": payment.gateway_transaction_id,
             "description": getattr(payment, 'description', None) or (
                 "Initial Booking" if payment_type == "INITIAL" else "Plan Extension"
@@ -372,23 +503,27 @@ async def get_payment_history(
             "venue_name": venue_name,
             "cabin_number": cabin_number,
             "date": payment.created_at.isoformat() if payment.created_at else None
-        })
+        }
     
-    return {
-        "payments": payment_list,
-        "total_count": len(payment_list),
-        "total_amount": sum(p["amount"] for p in payment_list)
-    }
+    return StreamingResponse(
+        _stream_payment_page(payments, build_entry, total_count, total_amount),
+        media_type="application/json",
+        headers=_cursor_headers(cursor_out)
+    )
 
 
 @router.get("/owner/payment-history")
 async def get_owner_payment_history(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all payment transactions for bookings at the owner's venues.
+    Get payment transactions for bookings at the owner's venues, newest first.
     Includes initial payments and extensions.
+    Keyset-paginated via the X-Next-Cursor header; totals cover every
+    matching payment, not just the page.
     """
     
     # Get owner's reading rooms
@@ -398,9 +533,10 @@ async def get_owner_payment_history(
     owner_rooms = rooms_result.scalars().all()
     
     if not owner_rooms:
-        return {"payments": [], "total_count": 0, "total_amount": 0}
+        return _empty_payment_history()
     
-    room_ids = [r.id for r in owner_rooms]
+    room_map = {r.id: r for r in owner_rooms}
+    room_ids = list(room_map)
     
     # Get all cabins in owner's rooms
     cabins_result = await db.execute(
@@ -411,45 +547,51 @@ async def get_owner_payment_history(
     cabin_map = {c.id: c for c in owner_cabins}
     
     if not cabin_ids:
-        return {"payments": [], "total_count": 0, "total_amount": 0}
+        return _empty_payment_history()
     
-    # Get all bookings for owner's cabins
-    bookings_result = await db.execute(
-        select(Booking).where(Booking.cabin_id.in_(cabin_ids))
+    payments_query = (
+        select(PaymentTransaction)
+        .join(Booking, Booking.id == PaymentTransaction.booking_id)
+        .where(Booking.cabin_id.in_(cabin_ids))
     )
-    owner_bookings = bookings_result.scalars().all()
-    booking_ids = [b.id for b in owner_bookings]
-    booking_map = {b.id: b for b in owner_bookings}
+    total_count, total_amount = await _payment_totals(db, payments_query)
+    if not total_count:
+        return _empty_payment_history()
+    
+    payments_query = payments_query.order_by(
+        desc(PaymentTransaction.created_at), desc(PaymentTransaction.id)
+    ).limit(limit + 1)
+    if cursor:
+        payments_query = payments_query.where(
+            tuple_(PaymentTransaction.created_at, PaymentTransaction.id) < decode_cursor(cursor)
+        )
     
-    if not booking_ids:
-        return {"payments": [], "total_count": 0, "total_amount": 0}
+    result = await db.execute(payments_query)
+    payments = result.scalars().all()
+    cursor_out = next_cursor(payments, limit)
     
-    # Get all payment transactions for these bookings
-    payments_result = await db.execute(
-        select(PaymentTransaction)
-        .where(PaymentTransaction.booking_id.in_(booking_ids))
-        .order_by(desc(PaymentTransaction.created_at))
+    # Cabins of just this page's bookings
+    booking_rows = await db.execute(
+        select(Booking.id, Booking.cabin_id).where(Booking.id.in_({p.booking_id for p in payments}))
+    )
+    booking_cabins = dict(booking_rows.all())
+    
+    # Get payer info in one query
+    users_result = await db.execute(
+        select(User).where(User.id.in_({p.user_id for p in payments}))
     )
-    payments = payments_result.scalars().all()
+    user_map = {u.id: u for u in users_result.scalars().all()}
     
-    payment_list = []
-    for payment in payments:
-        booking = booking_map.get(payment.booking_id)
-        cabin = cabin_map.get(booking.cabin_id) if booking else None
-        room = next((r for r in owner_rooms if cabin and r.id == cabin.reading_room_id), None) if cabin else None
+    def build_entry(payment: PaymentTransaction) -> dict:
+        cabin = cabin_map.get(booking_cabins.get(payment.booking_id))
+        room = room_map.get(cabin.reading_room_id) if cabin else None
         
-        # Get user info
-        user_result = await db.execute(
-            select(User).where(User.id == payment.user_id)
-        )
-        user = user_result.scalar_one_or_none()
+        user = user_map.get(payment.user_id)
         
         # Determine payment type
-        payment_type = "INITIAL"
-        if hasattr(payment, 'payment_type') and payment.payment_type:
-            payment_type = payment.payment_type.value if hasattr(payment.payment_type, 'value') else str(payment.payment_type)
+        payment_type = _PAYMENT_TYPE_VALUES.get(payment.payment_type, "INITIAL")
         
-        payment_list.append({
+        return {
             "id": payment.id,
             "booking_id": payment.booking_id,
             "user_id": payment.user_id,
@@ -464,75 +606,66 @@ async def get_owner_payment_history(
             "description": payment.description if hasattr(payment, 'description') and payment.description else (
                 "Plan Extension" if payment_type == "EXTENSION" else "Initial Booking"
             ),
-            "method": payment.method.value if payment.method else "UNKNOWN"
-        })
+            "method": _METHOD_VALUES.get(payment.method, "UNKNOWN")
+        }
     
-    return {
-        "payments": payment_list,
-        "total_count": len(payment_list),
-        "total_amount": sum(p["amount"] for p in payment_list)
-    }
+    return StreamingResponse(
+        _stream_payment_page(payments, build_entry, total_count, total_amount),
+        media_type="application/json",
+        headers=_cursor_headers(cursor_out)
+    )
 
 
-@router.get("/user/refunds", response_model=List[RefundOut])
+@router.get("/user/refunds", responses={200: {"model": List[RefundOut]}})
 async def get_my_refunds(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all refund requests for the current user.
+    Get the current user's refund requests, newest first.
+    Keyset-paginated: the next page's cursor is returned in the X-Next-Cursor header.
     """
-    result = await db.execute(
+    query = (
         select(Refund)
         .where(Refund.user_id == current_user.id)
-        .order_by(desc(Refund.requested_at))
+        .order_by(desc(Refund.requested_at), desc(Refund.id))
     )
+    if cursor:
+        query = query.where(tuple_(Refund.requested_at, Refund.id) < decode_cursor(cursor))
+    
+    result = await db.execute(query.limit(limit + 1))
     refunds = result.scalars().all()
+    cursor_out = next_cursor(refunds, limit, created_attr="requested_at")
+    
+    venues = await resolve_venue_names(db, {r.booking_id for r in refunds})
     
     refund_list = []
     for refund in refunds:
-        # Get venue name from booking
-        venue_name = "Unknown Venue"
-        booking_result = await db.execute(
-            select(Booking).where(Booking.id == refund.booking_id)
-        )
-        booking = booking_result.scalar_one_or_none()
+        venue_name = venues.get(refund.booking_id, UNKNOWN_VENUE)[0]
         
-        if booking:
-            if booking.cabin_id:
-                # Get cabin and reading room
-                cabin_result = await db.execute(
-                    select(Cabin).where(Cabin.id == booking.cabin_id)
-                )
-                cabin = cabin_result.scalar_one_or_none()
-                if cabin:
-                    room_result = await db.execute(
-                        select(ReadingRoom).where(ReadingRoom.id == cabin.reading_room_id)
-                    )
-                    room = room_result.scalar_one_or_none()
-                    if room:
-                        venue_name = room.name
-            elif booking.accommodation_id:
-                acc_result = await db.execute(
-                    select(Accommodation).where(Accommodation.id == booking.accommodation_id)
-                )
-                acc = acc_result.scalar_one_or_none()
-                if acc:
-                    venue_name = acc.name
+        processed_at = refund.processed_at
         
-        refund_list.append(RefundOut(
+        # Trusted DB data - skip per-field validation
+        refund_list.append(RefundOut.model_construct(
             id=refund.id,
             booking_id=refund.booking_id,
             venue_name=venue_name,
             amount=refund.amount,
-            reason=refund.reason.value if refund.reason else "OTHER",
+            reason=_REFUND_REASON_VALUES[refund.reason],
             reason_text=refund.reason_text,
-            status=refund.status.value if refund.status else "REQUESTED",
-            requested_at=refund.requested_at.isoformat() if refund.requested_at else "",
-            processed_at=refund.processed_at.isoformat() if refund.processed_at else None
+            status=_REFUND_STATUS_VALUES[refund.status],
+            requested_at=refund.requested_at.isoformat(),
+            processed_at=processed_at.isoformat() if processed_at else None
         ))
     
-    return refund_list
+    # Models were built from DB rows above; return them directly instead of
+    # having FastAPI re-validate the whole list against response_model
+    return ORJSONResponse(
+        [r.model_dump() for r in refund_list],
+        headers=_cursor_headers(cursor_out)
+    )
 
 
 @router.post("/refund/request", response_model=RefundOut)
@@ -547,15 +680,9 @@ async def request_refund(
     - Only one refund request per booking allowed
     """
     # Check if booking exists and belongs to user
-    result = await db.execute(
-        select(Booking).where(
-            Booking.id == data.booking_id,
-            Booking.user_id == current_user.id
-        )
-    )
-    booking = result.scalar_one_or_none()
+    booking = await db.get(Booking, data.booking_id)
     
-    if not booking:
+    if not booking or booking.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found or does not belong to you"
@@ -580,40 +707,24 @@ async def request_refund(
         reason_enum = RefundReason.OTHER
     
     # Get venue name for response
-    venue_name = "Unknown Venue"
-    if booking.cabin_id:
-        cabin_result = await db.execute(
-            select(Cabin).where(Cabin.id == booking.cabin_id)
-        )
-        cabin = cabin_result.scalar_one_or_none()
-        if cabin:
-            room_result = await db.execute(
-                select(ReadingRoom).where(ReadingRoom.id == cabin.reading_room_id)
-            )
-            room = room_result.scalar_one_or_none()
-            if room:
-                venue_name = room.name
-    elif booking.accommodation_id:
-        acc_result = await db.execute(
-            select(Accommodation).where(Accommodation.id == booking.accommodation_id)
+    venue_name = (await resolve_venue_names(db, {booking.id})).get(booking.id, UNKNOWN_VENUE)[0]
+    
+    # Create refund request - INSERT ... RETURNING hands back the generated
+    # id/requested_at, so no follow-up refresh SELECT is needed
+    result = await db.execute(
+        insert(Refund)
+        .values(
+            booking_id=data.booking_id,
+            user_id=current_user.id,
+            amount=booking.amount,
+            reason=reason_enum,
+            reason_text=data.reason_text,
+            status=RefundStatus.REQUESTED
         )
-        acc = acc_result.scalar_one_or_none()
-        if acc:
-            venue_name = acc.name
-    
-    # Create refund request
-    refund = Refund(
-        booking_id=data.booking_id,
-        user_id=current_user.id,
-        amount=booking.amount,
-        reason=reason_enum,
-        reason_text=data.reason_text,
-        status=RefundStatus.REQUESTED
+        .returning(Refund)
     )
-    
-    db.add(refund)
+    refund = result.scalar_one()
     await db.commit()
-    await db.refresh(refund)
     
     return RefundOut(
         id=refund.id,
@@ -632,15 +743,18 @@ async def request_refund(
 # SUPER ADMIN ENDPOINTS
 # ============================================
 
-@router.get("/admin/refunds", response_model=List[RefundAdminOut])
+@router.get("/admin/refunds", responses={200: {"model": List[RefundAdminOut]}})
 async def get_all_refunds(
     status_filter: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all refund requests (Super Admin only).
+    Get refund requests, newest first (Super Admin only).
     Optional filter by status.
+    Keyset-paginated: the next page's cursor is returned in the X-Next-Cursor header.
     """
     if current_user.role != UserRole.SUPER_ADMIN:
         raise HTTPException(
@@ -648,7 +762,7 @@ async def get_all_refunds(
             detail="Only Super Admin can access this endpoint"
         )
     
-    query = select(Refund).order_by(desc(Refund.requested_at))
+    query = select(Refund).order_by(desc(Refund.requested_at), desc(Refund.id))
     
     if status_filter:
         try:
@@ -657,55 +771,40 @@ async def get_all_refunds(
         except ValueError:
             pass  # Ignore invalid status filter
     
-    result = await db.execute(query)
+    if cursor:
+        query = query.where(tuple_(Refund.requested_at, Refund.id) < decode_cursor(cursor))
+    
+    result = await db.execute(query.limit(limit + 1))
     refunds = result.scalars().all()
+    cursor_out = next_cursor(refunds, limit, created_attr="requested_at")
+    
+    venues = await resolve_venue_names(db, {r.booking_id for r in refunds})
+    
+    # Requesters for the whole page in one query
+    users_result = await db.execute(
+        select(User).where(User.id.in_({r.user_id for r in refunds}))
+    )
+    user_map = {u.id: u for u in users_result.scalars().all()}
     
     refund_list = []
     for refund in refunds:
-        # Get user info
-        user_result = await db.execute(
-            select(User).where(User.id == refund.user_id)
-        )
-        user = user_result.scalar_one_or_none()
+        user = user_map.get(refund.user_id)
         
-        # Get venue name
-        venue_name = "Unknown Venue"
-        booking_result = await db.execute(
-            select(Booking).where(Booking.id == refund.booking_id)
-        )
-        booking = booking_result.scalar_one_or_none()
+        venue_name = venues.get(refund.booking_id, UNKNOWN_VENUE)[0]
         
-        if booking:
-            if booking.cabin_id:
-                cabin_result = await db.execute(
-                    select(Cabin).where(Cabin.id == booking.cabin_id)
-                )
-                cabin = cabin_result.scalar_one_or_none()
-                if cabin:
-                    room_result = await db.execute(
-                        select(ReadingRoom).where(ReadingRoom.id == cabin.reading_room_id)
-                    )
-                    room = room_result.scalar_one_or_none()
-                    if room:
-                        venue_name = room.name
-            elif booking.accommodation_id:
-                acc_result = await db.execute(
-                    select(Accommodation).where(Accommodation.id == booking.accommodation_id)
-                )
-                acc = acc_result.scalar_one_or_none()
-                if acc:
-                    venue_name = acc.name
+        processed_at = refund.processed_at
         
-        refund_list.append(RefundAdminOut(
+        # Trusted DB data - skip per-field validation
+        refund_list.append(RefundAdminOut.model_construct(
             id=refund.id,
             booking_id=refund.booking_id,
             venue_name=venue_name,
             amount=refund.amount,
-            reason=refund.reason.value if refund.reason else "OTHER",
+            reason=_REFUND_REASON_VALUES[refund.reason],
             reason_text=refund.reason_text,
-            status=refund.status.value if refund.status else "REQUESTED",
-            requested_at=refund.requested_at.isoformat() if refund.requested_at else "",
-            processed_at=refund.processed_at.isoformat() if refund.processed_at else None,
+            status=_REFUND_STATUS_VALUES[refund.status],
+            requested_at=refund.requested_at.isoformat(),
+            processed_at=processed_at.isoformat() if processed_at else None,
             user_id=refund.user_id,
             user_email=user.email if user else "",
             user_name=user.name if user else "Unknown",
@@ -713,7 +812,12 @@ async def get_all_refunds(
             reviewed_by=refund.reviewed_by
         ))
     
-    return refund_list
+    # Models were built from DB rows above; return them directly instead of
+    # having FastAPI re-validate the whole list against response_model
+    return ORJSONResponse(
+        [r.model_dump() for r in refund_list],
+        headers=_cursor_headers(cursor_out)
+    )
 
 
 @router.patch("/admin/refunds/{refund_id}")
@@ -736,10 +840,7 @@ async def update_refund_status(
             detail="Only Super Admin can update refund status"
         )
     
-    result = await db.execute(
-        select(Refund).where(Refund.id == refund_id)
-    )
-    refund = result.scalar_one_or_none()
+    refund = await db.get(Refund, refund_id)
     
     if not refund:
         raise HTTPException(
@@ -1,19 +1,94 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, AsyncSessionLocal
 from app.models.booking import Booking, PaymentStatus
 from app.models.user import User
+from app.models.audit_log import AuditLog, AuditActionType
 from app.services.payment_service import payment_service
 from app.deps import get_current_user
 
 router = APIRouter(prefix="/payments", tags=["Razorpay Payments"])
 
 
+async def send_refund_notification(booking_id: str, refund_id: str, amount: float, reason: str):
+    """Email the booking's owner that a refund was issued (background task)"""
+    try:
+        from app.services.email_service import send_refund_processed_email
+        
+        async with AsyncSessionLocal() as db:
+            booking = await db.get(Booking, booking_id)
+            user = await db.get(User, booking.user_id) if booking else None
+        if not user or not user.email:
+            return
+        
+        await send_refund_processed_email(
+            recipient_email=user.email,
+            recipient_name=user.name,
+            refund_details={
+                "booking_id": booking_id,
+                "refund_id": refund_id,
+                "amount": f"{amount:,.2f}",
+                "reason": reason
+            }
+        )
+    except Exception as e:
+        print(f"Failed to send refund notification: {e}")
+
+
+async def write_refund_audit_log(
+    actor_id: str,
+    actor_name: str,
+    actor_role: str,
+    booking_id: str,
+    refund_id: str,
+    amount: float,
+    reason: str
+):
+    """Record the refund in the audit trail (background task)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            db.add(AuditLog(
+                actor_id=actor_id,
+                actor_name=actor_name,
+                actor_role=actor_role,
+                action_type=AuditActionType.OTHER,
+                action_description=f"Refund {refund_id} of ₹{amount:,.2f} processed for booking {booking_id}",
+                entity_type="booking",
+                entity_id=booking_id,
+                extra_data={
+                    "refund_id": refund_id,
+                    "amount": amount,
+                    "reason": reason
+                },
+                timestamp=datetime.utcnow()
+            ))
+            await db.commit()
+    except Exception as e:
+        print(f"Failed to write refund audit log: {e}")
+
+
+async def get_booking_or_404(
+    db: AsyncSession,
+    booking_id: str,
+    user_id: Optional[str] = None,
+    for_update: bool = False
+) -> Booking:
+    """
+    Primary-key lookup of a booking (identity-map aware unless locking).
+    When user_id is given, a booking owned by someone else is treated as missing.
+    """
+    booking = await db.get(Booking, booking_id, with_for_update=for_update or None)
+    if booking is None or (user_id is not None and booking.user_id != user_id):
+        raise HTTPException(status_code=404, detail="Booking not found")
+    return booking
+
+
 class CreateOrderRequest(BaseModel):
     booking_id: str
     amount: float
@@ -39,6 +114,72 @@ class RefundRequest(BaseModel):
     reason: Optional[str] = None
 
 
+async def send_booking_confirmation(
+    booking_id: str,
+    recipient_email: str,
+    recipient_name: str,
+    payment_id: str
+):
+    """
+    Look up venue details and send the booking confirmation email.
+    Runs as a background task, so it opens its own DB session.
+    """
+    try:
+        from app.services.email_service import send_booking_confirmation_email
+        from app.models.reading_room import Cabin
+        
+        venue_name = "Venue"
+        venue_address = ""
+        cabin_number = None
+        booking_type = "booking"
+        
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Booking)
+                .options(
+                    selectinload(Booking.cabin).selectinload(Cabin.reading_room),
+                    selectinload(Booking.accommodation)
+                )
+                .where(Booking.id == booking_id)
+            )
+            booking = result.scalar_one_or_none()
+            if not booking:
+                return
+            
+            if booking.cabin_id:
+                cabin = booking.cabin
+                if cabin:
+                    cabin_number = cabin.number
+                    room = cabin.reading_room
+                    if room:
+                        venue_name = room.name
+                        venue_address = room.address or ""
+                booking_type = "cabin"
+            elif booking.accommodation_id:
+                accommodation = booking.accommodation
+                if accommodation:
+                    venue_name = accommodation.name
+                    venue_address = accommodation.address or ""
+                booking_type = "accommodation"
+        
+        await send_booking_confirmation_email(
+            recipient_email=recipient_email,
+            recipient_name=recipient_name,
+            booking_details={
+                "venue_name": venue_name,
+                "booking_type": booking_type,
+                "start_date": booking.start_date.strftime("%d %B %Y") if booking.start_date else "N/A",
+                "end_date": booking.end_date.strftime("%d %B %Y") if booking.end_date else "N/A",
+                "amount": f"{booking.amount:,.2f}",
+                "transaction_id": payment_id,
+                "venue_address": venue_address,
+                "cabin_number": cabin_number
+            }
+        )
+    except Exception as email_error:
+        print(f"Failed to send booking confirmation email: {email_error}")
+
+
 @router.post("/create-order", response_model=CreateOrderResponse)
 async def create_payment_order(
     request: CreateOrderRequest,
@@ -49,16 +190,8 @@ async def create_payment_order(
     Create a Razorpay order for a booking
     """
     # Verify booking exists and belongs to user
-    result = await db.execute(
-        select(Booking).where(
-            Booking.id == request.booking_id,
-            Booking.user_id == current_user.id
-        )
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
+    # Row lock serializes duplicate clicks until this request commits
+    booking = await get_booking_or_404(db, request.booking_id, current_user.id, for_update=True)
     
     if booking.payment_status == PaymentStatus.PAID:
         raise HTTPException(status_code=400, detail="Booking already paid")
@@ -89,6 +222,7 @@ async def create_payment_order(
 @router.post("/verify")
 async def verify_payment(
     request: VerifyPaymentRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -108,71 +242,33 @@ async def verify_payment(
     # Fetch payment details from Razorpay
     payment = payment_service.fetch_payment(request.razorpay_payment_id)
     
-    # Update booking
-    result = await db.execute(
-        select(Booking).where(
-            Booking.id == request.booking_id,
-            Booking.user_id == current_user.id
-        )
-    )
-    booking = result.scalar_one_or_none()
+    # Update booking (row lock so concurrent verifies apply once)
+    booking = await get_booking_or_404(db, request.booking_id, current_user.id, for_update=True)
     
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
+    # Already verified by an earlier request - don't re-apply or re-send email
+    if booking.payment_status == PaymentStatus.PAID and booking.transaction_id == request.razorpay_payment_id:
+        return {
+            "success": True,
+            "message": "Payment already verified",
+            "booking_id": booking.id,
+            "payment_id": request.razorpay_payment_id,
+            "amount": payment["amount"] / 100
+        }
     
     # Update payment status
     booking.payment_status = PaymentStatus.PAID
     booking.transaction_id = request.razorpay_payment_id
     
     await db.commit()
-    await db.refresh(booking)
     
-    # Send booking confirmation email
-    try:
-        from app.services.email_service import send_booking_confirmation_email
-        from app.models.reading_room import Cabin, ReadingRoom
-        from app.models.accommodation import Accommodation
-        
-        venue_name = "Venue"
-        venue_address = ""
-        cabin_number = None
-        booking_type = "booking"
-        
-        if booking.cabin_id:
-            cabin_result = await db.execute(select(Cabin).where(Cabin.id == booking.cabin_id))
-            cabin = cabin_result.scalar_one_or_none()
-            if cabin:
-                cabin_number = cabin.number
-                room_result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == cabin.reading_room_id))
-                room = room_result.scalar_one_or_none()
-                if room:
-                    venue_name = room.name
-                    venue_address = room.address or ""
-            booking_type = "cabin"
-        elif booking.accommodation_id:
-            acc_result = await db.execute(select(Accommodation).where(Accommodation.id == booking.accommodation_id))
-            accommodation = acc_result.scalar_one_or_none()
-            if accommodation:
-                venue_name = accommodation.name
-                venue_address = accommodation.address or ""
-            booking_type = "accommodation"
-        
-        await send_booking_confirmation_email(
-            recipient_email=current_user.email,
-            recipient_name=current_user.name,
-            booking_details={
-                "venue_name": venue_name,
-                "booking_type": booking_type,
-                "start_date": booking.start_date.strftime("%d %B %Y") if booking.start_date else "N/A",
-                "end_date": booking.end_date.strftime("%d %B %Y") if booking.end_date else "N/A",
-                "amount": f"{booking.amount:,.2f}",
-                "transaction_id": request.razorpay_payment_id,
-                "venue_address": venue_address,
-                "cabin_number": cabin_number
-            }
-        )
-    except Exception as email_error:
-        print(f"Failed to send booking confirmation email: {email_error}")
+    # Send booking confirmation email after the response is sent
+    background_tasks.add_task(
+        send_booking_confirmation,
+        booking.id,
+        current_user.email,
+        current_user.name,
+        request.razorpay_payment_id
+    )
     
     return {
         "success": True,
@@ -186,6 +282,7 @@ async def verify_payment(
 @router.post("/refund")
 async def refund_payment(
     request: RefundRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -193,33 +290,42 @@ async def refund_payment(
     Process refund for a booking (Admin/Owner only for now)
     """
     # Verify booking exists
-    result = await db.execute(
-        select(Booking).where(Booking.id == request.booking_id)
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
+    booking = await get_booking_or_404(db, request.booking_id)
     
     if booking.payment_status != PaymentStatus.PAID:
         raise HTTPException(status_code=400, detail="Booking is not paid")
     
     # Process refund
+    reason = request.reason or "User requested refund"
     refund = payment_service.refund_payment(
         payment_id=booking.transaction_id,
         amount=request.amount,
-        notes={"reason": request.reason or "User requested refund"}
+        notes={"reason": reason}
     )
     
     # Update booking status
     booking.payment_status = PaymentStatus.REFUNDED
     await db.commit()
     
+    # Notification and audit trail run after the response is sent
+    amount = refund["amount"] / 100
+    background_tasks.add_task(send_refund_notification, booking.id, refund["id"], amount, reason)
+    background_tasks.add_task(
+        write_refund_audit_log,
+        current_user.id,
+        current_user.name,
+        current_user.role.value,
+        booking.id,
+        refund["id"],
+        amount,
+        reason
+    )
+    
     return {
         "success": True,
         "message": "Refund processed successfully",
         "refund_id": refund["id"],
-        "amount": refund["amount"] / 100
+        "amount": amount
     }
 
 
@@ -232,16 +338,7 @@ async def get_payment_status(
     """
     Get payment status for a booking
     """
-    result = await db.execute(
-        select(Booking).where(
-            Booking.id == booking_id,
-            Booking.user_id == current_user.id
-        )
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
+    booking = await get_booking_or_404(db, booking_id, current_user.id)
     
     return {
         "booking_id": booking.id,
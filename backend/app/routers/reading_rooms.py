@@ -1,6 +1,7 @@
 from typing import List, Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, exists, func, insert, or_, update
 from sqlalchemy.future import select
 from app.database import get_db
 from app.models.reading_room import ReadingRoom, Cabin, CabinStatus, ListingStatus
@@ -8,15 +9,31 @@ from app.models.city import CitySettings
 from app.models.booking import Booking
 from app.schemas.reading_room import ReadingRoomCreate, ReadingRoomResponse, CabinCreate, ReadingRoomUpdate
 from app.models.user import User, UserRole
-from app.deps import get_current_user, get_current_admin, get_current_user_optional
+from app.deps import AuthSnapshot, get_current_user, get_current_admin, get_current_user_optional
 from pydantic import BaseModel
-import json
+import logging
 
 router = APIRouter(prefix="/reading-rooms", tags=["reading-rooms"])
 
-from app.utils.geo import haversine_distance, sort_by_proximity
+from app.utils.geo import haversine_vec, bounding_box
+from app.utils.city_cache import get_city_map
+from app.utils.venue_cache import invalidate_venue_name
+import numpy as np
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Trust statuses still shown in public listings (FLAGGED / SUSPENDED are hidden)
+PUBLIC_TRUST_STATUSES = ('CLEAR', 'UNDER_REVIEW')
+
+
+async def get_room_or_404(db: AsyncSession, room_id: str, detail: str = "Reading room not found") -> ReadingRoom:
+    """Primary-key lookup (identity-map aware) that raises 404 when missing"""
+    room = await db.get(ReadingRoom, room_id)
+    if room is None:
+        raise HTTPException(status_code=404, detail=detail)
+    return room
+
 
 @router.get("/", response_model=List[ReadingRoomResponse])
 async def get_reading_rooms(
@@ -48,48 +65,53 @@ async def get_reading_rooms(
         # For now, implementing strict requirement: Admin sees only PAID venues.
         query = query.where(ReadingRoom.status.notin_([ListingStatus.DRAFT, ListingStatus.PAYMENT_PENDING]))
 
-    result = await db.execute(query)
-    all_rooms = result.scalars().all()
-    
-    # Filter by City Status
-    settings_res = await db.execute(select(CitySettings))
-    city_map = {s.city_name.lower(): s.is_active for s in settings_res.scalars().all()}
-    
-    rooms = []
-    for r in all_rooms:
-        c_name = (r.city or "").strip().lower()
-        if city_map.get(c_name, True):
-            rooms.append(r)
+    # Filter by City Status - cities without a settings row are active
+    query = query.outerjoin(
+        CitySettings,
+        func.lower(func.trim(ReadingRoom.city)) == func.lower(CitySettings.city_name)
+    ).where(or_(CitySettings.is_active == True, CitySettings.city_name.is_(None)))
     
     # Filter by Trust Status - hide FLAGGED and SUSPENDED venues from public listings
-    # Owners and admins can still see their own flagged venues
-    trust_filtered_rooms = []
-    for room in rooms:
-        trust_status = getattr(room, 'trust_status', 'CLEAR') or 'CLEAR'
-        
-        # Super Admins can see all
-        if current_user and current_user.role == UserRole.SUPER_ADMIN:
-            trust_filtered_rooms.append(room)
-        # Owner can see their own venue regardless of trust status
-        elif current_user and room.owner_id == current_user.id:
-            trust_filtered_rooms.append(room)
-        # Public users only see CLEAR or UNDER_REVIEW venues
-        elif trust_status in ['CLEAR', 'UNDER_REVIEW']:
-            trust_filtered_rooms.append(room)
-        # FLAGGED and SUSPENDED venues are hidden from public
-        # (they can still see UNDER_REVIEW as it means owner is working on it)
+    # Super Admins see all; owners can still see their own flagged venues
+    # (UNDER_REVIEW stays public as it means owner is working on it)
+    if not (current_user and current_user.role == UserRole.SUPER_ADMIN):
+        trust_visible = or_(
+            ReadingRoom.trust_status.in_(PUBLIC_TRUST_STATUSES),
+            ReadingRoom.trust_status.is_(None)
+        )
+        if current_user:
+            trust_visible = or_(trust_visible, ReadingRoom.owner_id == current_user.id)
+        query = query.where(trust_visible)
     
-    rooms = trust_filtered_rooms
+    # Only rooms inside the radius' bounding box leave the DB; exact distance is checked below
+    if lat is not None and long is not None:
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, long, radius)
+        query = query.where(
+            ReadingRoom.latitude.between(min_lat, max_lat),
+            ReadingRoom.longitude.between(min_lon, max_lon)
+        )
+    
+    result = await db.execute(query)
+    rooms = result.scalars().all()
 
     if lat is not None and long is not None:
+        located = [room for room in rooms if room.latitude and room.longitude]
+        if not located:
+            return []
+        dists = haversine_vec(
+            lat, long,
+            np.array([room.latitude for room in located]),
+            np.array([room.longitude for room in located])
+        )
+        # Indices within radius, nearest first
+        nearby = np.flatnonzero(dists <= radius)
+        nearby = nearby[np.argsort(dists[nearby], kind="stable")]
         nearby_rooms = []
-        for room in rooms:
-            if room.latitude and room.longitude:
-                dist = haversine_distance(lat, long, room.latitude, room.longitude)
-                if dist <= radius:
-                    setattr(room, '_distance', dist)
-                    nearby_rooms.append(room)
-        return sort_by_proximity(lat, long, nearby_rooms)
+        for i in nearby:
+            room = located[i]
+            setattr(room, '_distance', float(dists[i]))
+            nearby_rooms.append(room)
+        return nearby_rooms
 
     return rooms
 
@@ -115,27 +137,13 @@ async def get_my_students(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    from app.models.booking import Booking
-    
-    # 1. Get Owner's Venues
-    r_result = await db.execute(select(ReadingRoom.id).where(ReadingRoom.owner_id == current_user.id))
-    room_ids = r_result.scalars().all()
-    
-    if not room_ids:
-        return []
-
-    # 2. Get Cabins
-    c_result = await db.execute(select(Cabin.id).where(Cabin.reading_room_id.in_(room_ids)))
-    cabin_ids = c_result.scalars().all()
-    
-    if not cabin_ids:
-        return []
-
-    # 3. Get Users for ALL bookings in these cabins
+    # Users with any booking on a cabin in one of the owner's venues
     query = (
         select(User)
         .join(Booking, Booking.user_id == User.id)
-        .where(Booking.cabin_id.in_(cabin_ids))
+        .join(Cabin, Cabin.id == Booking.cabin_id)
+        .join(ReadingRoom, ReadingRoom.id == Cabin.reading_room_id)
+        .where(ReadingRoom.owner_id == current_user.id)
         .distinct()
     )
     
@@ -148,18 +156,15 @@ async def get_my_students(
 async def create_reading_room(
     room: ReadingRoomCreate, 
     db: AsyncSession = Depends(get_db), 
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
-    import traceback
     try:
-        print(f"📝 Creating reading room for user: {current_user.email}")
-        print(f"📝 Room data: {room.model_dump()}")
+        logger.debug("Creating reading room for user %s: %s", current_user.email, room.model_dump())
         
         normalized_city = (room.city or "").strip().title()
         if normalized_city:
-            setting_res = await db.execute(select(CitySettings).where(CitySettings.city_name == normalized_city))
-            setting = setting_res.scalars().first()
-            if setting and not setting.is_active:
+            city_map = await get_city_map(db)
+            if not city_map.get(normalized_city.lower(), True):
                  raise HTTPException(status_code=400, detail=f"Operations in {normalized_city} are currently paused.")
 
         new_room = ReadingRoom(
@@ -172,14 +177,12 @@ async def create_reading_room(
         
         db.add(new_room)
         await db.commit()
-        await db.refresh(new_room)
-        print(f"✅ Room created with ID: {new_room.id}")
+        logger.debug("Room created with ID: %s", new_room.id)
         return new_room
     except HTTPException:
         raise  # Re-raise HTTP exceptions as-is
     except Exception as e:
-        print(f"❌ Error creating reading room: {e}")
-        traceback.print_exc()
+        logger.exception("Error creating reading room")
         raise HTTPException(status_code=500, detail=f"Failed to create reading room: {str(e)}")
 
 class CabinBatchCreate(BaseModel):
@@ -194,31 +197,30 @@ async def create_cabins_batch(
     room_id: str,
     batch: CabinBatchCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
-    result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == room_id))
-    room = result.scalars().first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Reading room not found")
+    room = await get_room_or_404(db, room_id)
         
     if room.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    cabins = []
-    for num in range(batch.start_number, batch.end_number + 1):
-        cabin = Cabin(
-            reading_room_id=room_id,
-            number=str(num),
-            floor=batch.floor,
-            price=batch.price,
-            amenities=batch.amenities,
-            status=CabinStatus.AVAILABLE
-        )
-        cabins.append(cabin)
-    
-    db.add_all(cabins)
-    await db.commit()
-    return {"message": f"{len(cabins)} cabins created successfully"}
+    rows = [
+        {
+            "reading_room_id": room_id,
+            "number": str(num),
+            "floor": batch.floor,
+            "price": batch.price,
+            "amenities": batch.amenities,
+            "status": CabinStatus.AVAILABLE
+        }
+        for num in range(batch.start_number, batch.end_number + 1)
+    ]
+    
+    # Single executemany INSERT instead of per-object unit-of-work flushes
+    if rows:
+        await db.execute(insert(Cabin), rows)
+        await db.commit()
+    return {"message": f"{len(rows)} cabins created successfully"}
 
 from app.schemas.reading_room import CabinResponse
 
@@ -227,12 +229,9 @@ async def create_cabin(
     room_id: str,
     cabin: CabinCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
-    result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == room_id))
-    room = result.scalars().first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Reading room not found")
+    room = await get_room_or_404(db, room_id)
     
     if room.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -243,7 +242,6 @@ async def create_cabin(
     )
     db.add(new_cabin)
     await db.commit()
-    await db.refresh(new_cabin)
     return new_cabin
 
 @router.get("/{room_id}", response_model=ReadingRoomResponse)
@@ -252,10 +250,7 @@ async def get_reading_room(
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
-    result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == room_id))
-    room = result.scalars().first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Reading room not found")
+    room = await get_room_or_404(db, room_id)
         
     is_public = room.status == ListingStatus.LIVE
     is_owner = current_user and room.owner_id == current_user.id
@@ -279,45 +274,23 @@ async def get_active_students_count(
     from sqlalchemy import func, distinct
     from app.models.booking import BookingStatus
     
-    # Get all cabins for this venue
-    cabins_result = await db.execute(
-        select(Cabin.id).where(Cabin.reading_room_id == room_id)
-    )
-    cabin_ids = [row[0] for row in cabins_result.fetchall()]
-    
-    if not cabin_ids:
-        print(f"⚠️ No cabins found for venue {room_id}")
-        return {"venue_id": room_id, "active_students": 0}
-    
-    print(f"✅ Found {len(cabin_ids)} cabins for venue {room_id}")
-    
     # Count unique users with ACTIVE bookings that haven't expired
     # Use timezone-aware datetime for comparison
     now = datetime.now(timezone.utc).replace(tzinfo=None)  # Make it naive for DB comparison
     
-    # Debug: Check all bookings for these cabins
-    debug_result = await db.execute(
-        select(Booking)
-        .where(Booking.cabin_id.in_(cabin_ids))
-    )
-    all_bookings = debug_result.scalars().all()
-    print(f"📊 Total bookings for venue: {len(all_bookings)}")
-    for b in all_bookings:
-        status_str = str(b.status) if hasattr(b.status, 'value') else b.status
-        print(f"  📋 Booking {b.id[:8]}...: status={status_str}, user={b.user_id[:8]}..., end_date={b.end_date}, now={now}, active={b.end_date >= now if b.end_date else False}")
-    
-    # Try both enum and string comparison to handle different storage formats
     result = await db.execute(
         select(func.count(distinct(Booking.user_id)))
+        .select_from(Booking)
+        .join(Cabin, Cabin.id == Booking.cabin_id)
         .where(
-            Booking.cabin_id.in_(cabin_ids),
+            Cabin.reading_room_id == room_id,
             Booking.status == BookingStatus.ACTIVE.value,  # Compare as string value
             Booking.end_date >= now
         )
     )
     active_count = result.scalar() or 0
     
-    print(f"✨ Active students count: {active_count}")
+    logger.debug("Venue %s: %s active students", room_id, active_count)
     
     return {
         "venue_id": room_id,
@@ -329,16 +302,8 @@ async def update_reading_room(
     room_id: str,
     updates: ReadingRoomUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
-    result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == room_id))
-    room = result.scalars().first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Reading room not found")
-    
-    if room.owner_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
     update_data = updates.model_dump(exclude_unset=True)
     
     # Security: Prevent unauthorized status changes
@@ -349,12 +314,28 @@ async def update_reading_room(
             # Optionally allow transition to DRAFT? 
             # For now, strict: Remove status from updates initiated by Owner
             del update_data["status"]
-            
-    for key, value in update_data.items():
-        setattr(room, key, value)
+    
+    if not update_data:
+        room = await get_room_or_404(db, room_id)
+        if room.owner_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+        return room
+    
+    # Ownership is enforced by the WHERE clause: one UPDATE ... RETURNING round-trip
+    result = await db.execute(
+        update(ReadingRoom)
+        .where(ReadingRoom.id == room_id, ReadingRoom.owner_id == current_user.id)
+        .values(**update_data)
+        .returning(ReadingRoom)
+    )
+    room = result.scalar_one_or_none()
+    if room is None:
+        # Nothing updated - tell missing (404) apart from not owned (403)
+        await get_room_or_404(db, room_id)
+        raise HTTPException(status_code=403, detail="Not authorized")
     
     await db.commit()
-    await db.refresh(room)
+    invalidate_venue_name("reading_room", room_id)
     return room
 
 
@@ -362,39 +343,31 @@ async def update_reading_room(
 async def delete_reading_room(
     room_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
     """Delete a reading room. Only owner can delete. Cannot delete if there are any bookings."""
-    result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == room_id))
-    room = result.scalars().first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Reading room not found")
+    room = await get_room_or_404(db, room_id)
     
     if room.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this venue")
     
     # Check for any bookings on cabins in this reading room
-    cabins = (await db.execute(select(Cabin).where(Cabin.reading_room_id == room_id))).scalars().all()
-    cabin_ids = [c.id for c in cabins]
-    
-    if cabin_ids:
-        bookings_check = await db.execute(
-            select(Booking).where(Booking.cabin_id.in_(cabin_ids))
+    has_booking = (await db.execute(
+        select(exists().where(
+            Booking.cabin_id.in_(select(Cabin.id).where(Cabin.reading_room_id == room_id))
+        ))
+    )).scalar()
+    if has_booking:
+        raise HTTPException(
+            status_code=400, 
+            detail="Cannot delete reading room with existing bookings. Please contact support if you need to remove this listing."
         )
-        existing_bookings = bookings_check.scalars().first()
-        if existing_bookings:
-            raise HTTPException(
-                status_code=400, 
-                detail="Cannot delete reading room with existing bookings. Please contact support if you need to remove this listing."
-            )
-    
-    # Delete associated cabins first
-    for cabin in cabins:
-        await db.delete(cabin)
     
-    # Delete the reading room
-    await db.delete(room)
+    # Delete associated cabins first, then the reading room
+    await db.execute(delete(Cabin).where(Cabin.reading_room_id == room_id))
+    await db.execute(delete(ReadingRoom).where(ReadingRoom.id == room_id))
     await db.commit()
+    invalidate_venue_name("reading_room", room_id)
     
     return {"message": "Reading room deleted successfully"}
 
@@ -403,12 +376,9 @@ async def delete_reading_room(
 async def submit_payment(
     room_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
-    result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == room_id))
-    room = result.scalars().first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Venue not found")
+    room = await get_room_or_404(db, room_id, detail="Venue not found")
         
     if room.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -424,13 +394,7 @@ async def submit_payment(
     if not room.contact_phone: errors.append("Phone")
     
     # Image Validation
-    valid_images = False
-    if room.images:
-        try:
-            imgs = json.loads(room.images)
-            if isinstance(imgs, list) and len(imgs) >= 4:
-                valid_images = True
-        except: pass
+    valid_images = isinstance(room.images, list) and len(room.images) >= 4
     
     # Check for legacy single image_url if images not set (Migration support)
     # If no images list, fail.
@@ -449,18 +413,14 @@ async def submit_payment(
 async def verify_reading_room(
     room_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
-    result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == room_id))
-    room = result.scalars().first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Reading room not found")
+    room = await get_room_or_404(db, room_id)
     
     # Update to LIVE
     room.status = ListingStatus.LIVE
     room.is_verified = True
     await db.commit()
-    await db.refresh(room)
     return room
 
 class RejectRequest(BaseModel):
@@ -471,16 +431,12 @@ async def reject_reading_room(
     room_id: str,
     rejection: RejectRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_admin)
 ):
-    result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == room_id))
-    room = result.scalars().first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Reading room not found")
+    room = await get_room_or_404(db, room_id)
     
     room.status = ListingStatus.REJECTED
     room.is_verified = False
     
     await db.commit()
-    await db.refresh(room)
     return room
@@ -3,8 +3,10 @@
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 from app.database import get_db
+from app.deps import clear_auth_cache
+from app.utils import city_cache
 from datetime import datetime
 import logging
 
@@ -12,6 +14,17 @@ router = APIRouter(prefix="/admin", tags=["Admin Reset"])
 
 logger = logging.getLogger(__name__)
 
+# Data tables wiped on reset, children before parents (order matters for the DELETE fallback)
+RESET_TABLES = [
+    "bookings", "reviews", "waitlist_entries", "cabins", "inquiries",
+    "refunds", "payment_transactions", "trust_flags", "reminders", "audit_logs",
+    "reading_rooms", "accommodations", "ads", "city_settings",
+]
+
+async def _existing_tables(db: AsyncSession) -> set:
+    """Names of tables that exist in the current schema (one catalog query)"""
+    return await db.run_sync(lambda session: set(inspect(session.connection()).get_table_names()))
+
 @router.post("/reset-database")
 async def reset_database(db: AsyncSession = Depends(get_db)):
     """
@@ -25,44 +38,42 @@ async def reset_database(db: AsyncSession = Depends(get_db)):
     start_time = datetime.now()
     
     try:
-        # Order matters due to foreign key constraints
-        # Delete child tables first, then parent tables
-        
-        tables_to_truncate = [
-            # Child tables first (have foreign keys)
-            ("bookings", "DELETE FROM bookings"),
-            ("reviews", "DELETE FROM reviews"),
-            ("waitlist_entries", "DELETE FROM waitlist_entries"),
-            ("cabins", "DELETE FROM cabins"),
-            ("inquiries", "DELETE FROM inquiries"),
-            ("refunds", "DELETE FROM refunds"),
-            ("payment_transactions", "DELETE FROM payment_transactions"),
-            ("trust_flags", "DELETE FROM trust_flags"),
-            ("reminders", "DELETE FROM reminders"),
-            ("audit_logs", "DELETE FROM audit_logs"),
-            
-            # Parent tables (after children are deleted)
-            ("reading_rooms", "DELETE FROM reading_rooms"),
-            ("accommodations", "DELETE FROM accommodations"),
-            ("ads", "DELETE FROM ads"),
-            ("city_settings", "DELETE FROM city_settings"),
-            
-            # Users - keep Super Admin only
-            ("users", "DELETE FROM users WHERE role != 'SUPER_ADMIN'"),
-        ]
+        if db.bind.dialect.name == "postgresql":
+            # One TRUNCATE for every existing data table; CASCADE handles FK order
+            existing = await _existing_tables(db)
+            tables = [t for t in RESET_TABLES if t in existing]
+            for t in RESET_TABLES:
+                if t not in existing:
+                    reset_log.append(f"⚠ {t}: table does not exist")
+            if tables:
+                await db.execute(text(f"TRUNCATE TABLE {', '.join(tables)} RESTART IDENTITY CASCADE"))
+                reset_log.append(f"✓ truncated: {', '.join(tables)}")
+                logger.info(f"Reset: Truncated {len(tables)} tables")
+        else:
+            # No TRUNCATE (e.g. SQLite) - delete child tables first, then parents
+            for table_name in RESET_TABLES:
+                try:
+                    result = await db.execute(text(f"DELETE FROM {table_name}"))
+                    rows_deleted = result.rowcount
+                    reset_log.append(f"✓ {table_name}: {rows_deleted} rows deleted")
+                    logger.info(f"Reset: Deleted {rows_deleted} rows from {table_name}")
+                except Exception as e:
+                    # Table might not exist yet
+                    reset_log.append(f"⚠ {table_name}: {str(e)}")
+                    logger.warning(f"Reset warning for {table_name}: {str(e)}")
         
-        for table_name, sql in tables_to_truncate:
-            try:
-                result = await db.execute(text(sql))
-                rows_deleted = result.rowcount
-                reset_log.append(f"✓ {table_name}: {rows_deleted} rows deleted")
-                logger.info(f"Reset: Deleted {rows_deleted} rows from {table_name}")
-            except Exception as e:
-                # Table might not exist yet
-                reset_log.append(f"⚠ {table_name}: {str(e)}")
-                logger.warning(f"Reset warning for {table_name}: {str(e)}")
+        # Users - keep Super Admin only
+        try:
+            result = await db.execute(text("DELETE FROM users WHERE role != 'SUPER_ADMIN'"))
+            reset_log.append(f"✓ users: {result.rowcount} rows deleted")
+            logger.info(f"Reset: Deleted {result.rowcount} rows from users")
+        except Exception as e:
+            reset_log.append(f"⚠ users: {str(e)}")
+            logger.warning(f"Reset warning for users: {str(e)}")
         
         await db.commit()
+        city_cache.invalidate()
+        clear_auth_cache()
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -93,13 +104,14 @@ async def get_reset_status(db: AsyncSession = Depends(get_db)):
         "refunds", "payment_transactions", "trust_flags", "ads"
     ]
     
-    counts = {}
-    for table in tables:
-        try:
-            result = await db.execute(text(f"SELECT COUNT(*) FROM {table}"))
-            counts[table] = result.scalar()
-        except:
-            counts[table] = "N/A"
+    # One UNION ALL over the tables that exist; table names are a fixed allowlist
+    existing = await _existing_tables(db)
+    counts = {table: "N/A" for table in tables}
+    present = [t for t in tables if t in existing]
+    if present:
+        sql = " UNION ALL ".join(f"SELECT '{t}' AS name, COUNT(*) AS n FROM {t}" for t in present)
+        result = await db.execute(text(sql))
+        counts.update({row.name: row.n for row in result})
     
     return {
         "counts": counts,
@@ -1,21 +1,108 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Boolean, DateTime, String, bindparam, cast, desc, literal_column, null, text, tuple_, union_all
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.future import select
-from typing import List, Optional
+from typing import List, Optional, Tuple, Any
 from datetime import datetime, timedelta, timezone
+import logging
+from cachetools import TTLCache
 
 from app.database import get_db
 from app.models.review import Review
-from app.models.booking import Booking, BookingStatus
+from app.models.booking import Booking
 from app.schemas.review import ReviewCreate, ReviewResponse
 from app.deps import get_current_user
+from app.utils.http_cache import PRIVATE_SHORT, PUBLIC_SHORT, compute_etag, not_modified
+from app.utils.pagination import decode_cursor, next_cursor
 from app.models.user import User
 
 router = APIRouter(prefix="/reviews", tags=["Reviews"])
 
+logger = logging.getLogger(__name__)
+
 # Review eligibility delay in hours
 REVIEW_ELIGIBILITY_HOURS = 48
 
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Memo of /reviews/eligibility responses keyed by (user_id, reading_room_id, accommodation_id).
+# The 48h rule can't flip within a minute; create_review drops the key it affects.
+ELIGIBILITY_CACHE_TTL = 60  # seconds
+_ELIG_CACHE: TTLCache = TTLCache(maxsize=50_000, ttl=ELIGIBILITY_CACHE_TTL)
+
+
+# Earliest confirmed booking for a venue, as prebuilt textual SELECTs (one per venue kind)
+# so the hot eligibility path does no per-call query construction. Status literals
+# mirror CONFIRMED_BOOKING_STATUSES and the ix_bookings_confirmed_user_start predicate.
+_ELIG_BOOKING_COLUMNS = dict(id=String, start_date=DateTime, is_eligible=Boolean)
+_ELIG_BOOKING_PARAMS = (
+    bindparam("user_id", type_=String),
+    bindparam("venue_id", type_=String),
+    bindparam("cutoff", type_=DateTime),
+)
+_ELIG_BOOKING_BY_ROOM_SQL = text("""
+    SELECT b.id, b.start_date, b.start_date <= :cutoff AS is_eligible
+    FROM bookings b JOIN cabins c ON c.id = b.cabin_id
+    WHERE b.user_id = :user_id AND b.status IN ('ACTIVE', 'EXPIRED') AND c.reading_room_id = :venue_id
+    ORDER BY b.start_date ASC
+    LIMIT 1
+""").bindparams(*_ELIG_BOOKING_PARAMS).columns(**_ELIG_BOOKING_COLUMNS)
+_ELIG_BOOKING_BY_ACC_SQL = text("""
+    SELECT b.id, b.start_date, b.start_date <= :cutoff AS is_eligible
+    FROM bookings b
+    WHERE b.user_id = :user_id AND b.status IN ('ACTIVE', 'EXPIRED') AND b.accommodation_id = :venue_id
+    ORDER BY b.start_date ASC
+    LIMIT 1
+""").bindparams(*_ELIG_BOOKING_PARAMS).columns(**_ELIG_BOOKING_COLUMNS)
+
+
+def _eligible_booking_stmt(
+    user_id: str,
+    reading_room_id: Optional[str],
+    accommodation_id: Optional[str]
+):
+    """
+    Earliest confirmed booking (id, start_date, is_eligible) for the venue; None when no venue is given.
+    is_eligible is the 48-hour rule evaluated in SQL against a cutoff bound once per call
+    (start_date is stored as naive UTC).
+    """
+    if reading_room_id:
+        # Booked cabin must belong to this reading room
+        stmt, venue_id = _ELIG_BOOKING_BY_ROOM_SQL, reading_room_id
+    elif accommodation_id:
+        stmt, venue_id = _ELIG_BOOKING_BY_ACC_SQL, accommodation_id
+    else:
+        return None
+    
+    cutoff = datetime.utcnow() - timedelta(hours=REVIEW_ELIGIBILITY_HOURS)
+    return stmt.bindparams(user_id=user_id, venue_id=venue_id, cutoff=cutoff)
+
+
+NO_VENUE_RESULT = {"eligible": False, "reason": "No venue specified", "hours_remaining": None, "booking_id": None}
+
+
+def _evaluate_eligibility(booking) -> dict:
+    """Apply the 48-hour rule to the earliest booking row (or None)"""
+    if not booking:
+        return {"eligible": False, "reason": "No confirmed booking found for this venue", "hours_remaining": None, "booking_id": None}
+    
+    # 48-hour rule already decided in SQL; datetime math only for the countdown
+    if booking.is_eligible:
+        return {"eligible": True, "reason": "Eligible to review", "hours_remaining": 0, "booking_id": booking.id}
+    
+    eligible_at = booking.start_date.replace(tzinfo=timezone.utc) + timedelta(hours=REVIEW_ELIGIBILITY_HOURS)
+    remaining = eligible_at - datetime.now(timezone.utc)
+    hours_remaining = max(int(remaining.total_seconds() / 3600), 0)
+    return {
+        "eligible": False, 
+        "reason": f"You can write a review after {hours_remaining} hours",
+        "hours_remaining": hours_remaining,
+        "booking_id": booking.id,
+        "eligible_at": eligible_at.isoformat()
+    }
+
 
 async def check_review_eligibility(
     user_id: str,
@@ -28,56 +115,54 @@ async def check_review_eligibility(
     User must have a confirmed booking that started at least 48 hours ago.
     Returns: { eligible: bool, reason: str, hours_remaining: int | None, booking_id: str | None }
     """
-    # Build query based on venue type
-    query = select(Booking).where(
-        Booking.user_id == user_id,
-        Booking.status.in_([BookingStatus.ACTIVE, BookingStatus.EXPIRED])  # Only confirmed bookings
-    )
-    
-    if reading_room_id:
-        query = query.where(Booking.cabin_id.isnot(None))
-        # We need to check if the cabin belongs to this reading room
-        from app.models.reading_room import Cabin
-        cabin_query = select(Cabin.id).where(Cabin.reading_room_id == reading_room_id)
-        cabin_result = await db.execute(cabin_query)
-        cabin_ids = [c for c in cabin_result.scalars().all()]
-        if not cabin_ids:
-            return {"eligible": False, "reason": "No cabins found for this venue", "hours_remaining": None, "booking_id": None}
-        query = query.where(Booking.cabin_id.in_(cabin_ids))
-    elif accommodation_id:
-        query = query.where(Booking.accommodation_id == accommodation_id)
-    else:
-        return {"eligible": False, "reason": "No venue specified", "hours_remaining": None, "booking_id": None}
+    query = _eligible_booking_stmt(user_id, reading_room_id, accommodation_id)
+    if query is None:
+        return dict(NO_VENUE_RESULT)
     
-    # Get the earliest confirmed booking
-    query = query.order_by(Booking.start_date.asc())
     result = await db.execute(query)
-    booking = result.scalars().first()
-    
-    if not booking:
-        return {"eligible": False, "reason": "No confirmed booking found for this venue", "hours_remaining": None, "booking_id": None}
-    
-    # Check 48-hour eligibility
-    now = datetime.now(timezone.utc)
-    booking_start = booking.start_date.replace(tzinfo=timezone.utc) if booking.start_date.tzinfo is None else booking.start_date
-    eligible_at = booking_start + timedelta(hours=REVIEW_ELIGIBILITY_HOURS)
-    
-    if now < eligible_at:
-        remaining = eligible_at - now
-        hours_remaining = int(remaining.total_seconds() / 3600)
-        return {
-            "eligible": False, 
-            "reason": f"You can write a review after {hours_remaining} hours",
-            "hours_remaining": hours_remaining,
-            "booking_id": booking.id,
-            "eligible_at": eligible_at.isoformat()
-        }
+    return _evaluate_eligibility(result.first())
+
+
+async def check_eligibility_and_existing_review(
+    user_id: str,
+    reading_room_id: Optional[str],
+    accommodation_id: Optional[str],
+    review_stmt,
+    db: AsyncSession
+) -> Tuple[dict, Optional[Any]]:
+    """
+    Eligibility plus the user's existing review in one round-trip.
+    review_stmt must select (Review.id, Review.rating, Review.comment) with LIMIT 1;
+    both lookups are combined with UNION ALL and told apart by a "kind" column.
+    Returns: (eligibility dict, review row or None)
+    """
+    booking_stmt = _eligible_booking_stmt(user_id, reading_room_id, accommodation_id)
+    if booking_stmt is None:
+        result = await db.execute(review_stmt)
+        return dict(NO_VENUE_RESULT), result.first()
     
-    return {"eligible": True, "reason": "Eligible to review", "hours_remaining": 0, "booking_id": booking.id}
+    b = booking_stmt.subquery()
+    r = review_stmt.subquery()
+    combined = union_all(
+        select(
+            literal_column("'booking'", String).label("kind"), b.c.id, b.c.start_date, b.c.is_eligible,
+            cast(null(), Review.rating.type).label("rating"),
+            cast(null(), Review.comment.type).label("comment")
+        ),
+        select(
+            literal_column("'review'", String), r.c.id, cast(null(), Booking.start_date.type),
+            cast(null(), Boolean), r.c.rating, r.c.comment
+        )
+    )
+    rows = (await db.execute(combined)).all()
+    booking = next((row for row in rows if row.kind == "booking"), None)
+    review = next((row for row in rows if row.kind == "review"), None)
+    return _evaluate_eligibility(booking), review
 
 
 @router.get("/eligibility")
 async def check_review_eligibility_endpoint(
+    response: Response,
     reading_room_id: Optional[str] = None,
     accommodation_id: Optional[str] = None,
     current_user: User = Depends(get_current_user),
@@ -87,22 +172,26 @@ async def check_review_eligibility_endpoint(
     Check if user is eligible to write a review for a venue.
     Returns eligibility status and hours remaining if not eligible.
     """
-    eligibility = await check_review_eligibility(
-        current_user.id, reading_room_id, accommodation_id, db
-    )
+    # Per-user answer: browser may reuse it briefly, shared caches must not
+    response.headers["Cache-Control"] = PRIVATE_SHORT
+    cache_key = (current_user.id, reading_room_id, accommodation_id)
+    cached = _ELIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
     
-    # Also check if user has already reviewed
-    stmt = select(Review).where(Review.user_id == current_user.id)
+    # Also check if user has already reviewed (same round-trip)
+    stmt = select(Review.id, Review.rating, Review.comment).where(Review.user_id == current_user.id)
     if reading_room_id:
         stmt = stmt.where(Review.reading_room_id == reading_room_id)
     if accommodation_id:
         stmt = stmt.where(Review.accommodation_id == accommodation_id)
     
-    result = await db.execute(stmt)
-    existing = result.scalars().first()
+    eligibility, existing = await check_eligibility_and_existing_review(
+        current_user.id, reading_room_id, accommodation_id, stmt.limit(1), db
+    )
     
     if existing:
-        return {
+        result = {
             "eligible": False,
             "reason": "You have already reviewed this venue",
             "hasReviewed": True,
@@ -112,8 +201,11 @@ async def check_review_eligibility_endpoint(
                 "comment": existing.comment
             }
         }
+    else:
+        result = {**eligibility, "hasReviewed": False}
     
-    return {**eligibility, "hasReviewed": False}
+    _ELIG_CACHE[cache_key] = result
+    return result
 
 
 @router.get("/status")
@@ -123,15 +215,14 @@ async def check_review_status(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    print(f"Checking review status for user {current_user.id}, RR: {reading_room_id}, Acc: {accommodation_id}")
+    logger.debug("Checking review status for user %s RR=%s Acc=%s", current_user.id, reading_room_id, accommodation_id)
     stmt = select(Review).where(
         Review.user_id == current_user.id,
         Review.reading_room_id == reading_room_id,
         Review.accommodation_id == accommodation_id
-    )
-    result = await db.execute(stmt)
-    existing = result.scalars().first()
-    print(f"Review status result: {existing}")
+    ).limit(1)
+    existing = await db.scalar(stmt)
+    logger.debug("Review status result: %s", existing)
     
     if existing:
         return {
@@ -151,7 +242,7 @@ async def create_review(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    print(f"Received review: {review.model_dump()}")
+    logger.debug("Received review from user %s: %s", current_user.id, review)
     
     # ========================================
     # 48-HOUR ELIGIBILITY CHECK (CRITICAL)
@@ -165,50 +256,79 @@ async def create_review(
             status_code=400,
             detail=eligibility["reason"]
         )
-    
-    # Check for existing review
-    stmt = select(Review).where(
-        Review.user_id == current_user.id,
-        Review.reading_room_id == review.reading_room_id,
-        Review.accommodation_id == review.accommodation_id
+
+    # Duplicate check is the unique (user, venue) index itself: ON CONFLICT DO NOTHING
+    # returns no row instead of racing a separate SELECT
+    insert = postgresql.insert if db.bind.dialect.name == "postgresql" else sqlite.insert
+    stmt = (
+        insert(Review)
+        .values(user_id=current_user.id, **review.model_dump())
+        .on_conflict_do_nothing()
+        .returning(Review)
     )
-    result = await db.execute(stmt)
-    existing_review = result.scalars().first()
+    try:
+        new_review = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+    except Exception as e:
+        logger.exception("Error creating review")
+        raise HTTPException(status_code=500, detail=str(e))
     
-    if existing_review:
+    if new_review is None:
         raise HTTPException(
             status_code=400,
             detail="You have already reviewed this place."
         )
-
-    try:
-        new_review = Review(
-            user_id=current_user.id,
-            **review.model_dump()
-        )
-        db.add(new_review)
-        await db.commit()
-        await db.refresh(new_review)
-        return new_review
-    except Exception as e:
-        print(f"Error creating review: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    _ELIG_CACHE.pop((current_user.id, review.reading_room_id, review.accommodation_id), None)
+    return new_review
 
 @router.get("/", response_model=List[ReviewResponse])
 async def get_reviews(
+    request: Request,
+    response: Response,
     reading_room_id: Optional[str] = None,
     accommodation_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ):
-    query = select(Review)
+    """
+    Reviews newest first, keyset-paginated: the cursor for the next page is
+    returned in the X-Next-Cursor header (absent on the last page).
+    """
+    # Plain rows rather than ORM instances; response_model validates them
+    query = select(
+        Review.id,
+        Review.user_id,
+        Review.reading_room_id,
+        Review.accommodation_id,
+        Review.rating,
+        Review.comment,
+        Review.created_at
+    )
     if reading_room_id:
         query = query.where(Review.reading_room_id == reading_room_id)
     if accommodation_id:
         query = query.where(Review.accommodation_id == accommodation_id)
     if user_id:
         query = query.where(Review.user_id == user_id)
-        
-    result = await db.execute(query)
-    return result.scalars().all()
+    if cursor:
+        query = query.where(tuple_(Review.created_at, Review.id) < decode_cursor(cursor))
+    
+    query = query.order_by(desc(Review.created_at), desc(Review.id)).limit(limit + 1)
+    rows = list((await db.execute(query)).all())
+    cursor_out = next_cursor(rows, limit)
+    reviews = [row._asdict() for row in rows]
+    
+    # URL (incl. query string) is the cache key, so each filter combination gets its own entry
+    etag = compute_etag(reviews)
+    unchanged = not_modified(request, etag, PUBLIC_SHORT)
+    if unchanged:
+        return unchanged
+    response.headers["Cache-Control"] = PUBLIC_SHORT
+    response.headers["ETag"] = etag
+    if cursor_out:
+        response.headers["X-Next-Cursor"] = cursor_out
+    return reviews
 
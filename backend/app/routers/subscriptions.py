@@ -1,20 +1,30 @@
 """
 Subscriptions Router - CRUD for subscription plans
 """
+import asyncio
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
 from sqlalchemy.future import select
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from app.database import get_db
 from app.models.subscription_plan import SubscriptionPlan
-from app.models.user import User, UserRole
-from app.deps import get_current_user, get_current_admin, get_current_user_optional
+from app.deps import AuthSnapshot, get_current_user, get_current_super_admin, get_current_user_optional
+from app.utils.http_cache import PUBLIC_SHORT, compute_etag, not_modified
+from app.utils.plan_cache import invalidate_plans
 
 
 router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
 
+# Plan list is public and read on every page load but changes rarely, so the
+# serialized response (with its ETag) is memoized per include_inactive flag and cleared on writes.
+PLAN_CACHE_TTL = 30  # seconds
+_PLAN_CACHE: TTLCache = TTLCache(maxsize=2, ttl=PLAN_CACHE_TTL)
+_plan_cache_lock = asyncio.Lock()
+
 
 # ============================================================
 # SCHEMAS
@@ -52,6 +62,11 @@ class SubscriptionPlanResponse(BaseModel):
     created_by: str
     created_at: datetime
     
+    @field_validator('features', mode='before')
+    @classmethod
+    def default_features(cls, v):
+        return v or []
+    
     class Config:
         from_attributes = True
 
@@ -62,6 +77,8 @@ class SubscriptionPlanResponse(BaseModel):
 
 @router.get("/plans", response_model=List[SubscriptionPlanResponse])
 async def get_subscription_plans(
+    request: Request,
+    response: Response,
     include_inactive: bool = False,
     db: AsyncSession = Depends(get_db)
 ):
@@ -69,46 +86,62 @@ async def get_subscription_plans(
     Get all subscription plans.
     By default returns only active plans. Super Admin can see all.
     """
-    query = select(SubscriptionPlan).order_by(SubscriptionPlan.price)
+    cached = _PLAN_CACHE.get(include_inactive)
+    if cached is None:
+        async with _plan_cache_lock:
+            # Another request may have filled it while we waited
+            cached = _PLAN_CACHE.get(include_inactive)
+            if cached is None:
+                plans = await _load_plans(include_inactive, db)
+                cached = (plans, compute_etag(plans))
+                _PLAN_CACHE[include_inactive] = cached
+
+    plans, etag = cached
+    unchanged = not_modified(request, etag, PUBLIC_SHORT)
+    if unchanged:
+        return unchanged
+    response.headers["Cache-Control"] = PUBLIC_SHORT
+    response.headers["ETag"] = etag
+    return plans
+
+
+async def _load_plans(include_inactive: bool, db: AsyncSession) -> List[SubscriptionPlanResponse]:
+    # Plain rows for just the response columns - no ORM hydration
+    query = select(
+        SubscriptionPlan.id,
+        SubscriptionPlan.name,
+        SubscriptionPlan.description,
+        SubscriptionPlan.price,
+        SubscriptionPlan.duration_days,
+        SubscriptionPlan.features,
+        SubscriptionPlan.is_active,
+        SubscriptionPlan.is_default,
+        SubscriptionPlan.created_by,
+        SubscriptionPlan.created_at
+    ).order_by(SubscriptionPlan.price)
     
     if not include_inactive:
         query = query.where(SubscriptionPlan.is_active == True)
     
     result = await db.execute(query)
-    plans = result.scalars().all()
     
-    return [
-        SubscriptionPlanResponse(
-            id=p.id,
-            name=p.name,
-            description=p.description,
-            price=p.price,
-            duration_days=p.duration_days,
-            features=p.features or [],
-            is_active=p.is_active,
-            is_default=p.is_default,
-            created_by=p.created_by,
-            created_at=p.created_at
-        )
-        for p in plans
-    ]
+    return [SubscriptionPlanResponse.model_validate(dict(row)) for row in result.mappings().all()]
 
 
 @router.post("/plans", response_model=SubscriptionPlanResponse)
 async def create_subscription_plan(
     plan: SubscriptionPlanCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_super_admin)
 ):
     """Create a new subscription plan. Super Admin only."""
-    if current_user.role != UserRole.SUPER_ADMIN:
-        raise HTTPException(status_code=403, detail="Only Super Admin can create subscription plans")
-    
-    # If this is set as default, unset other defaults
+    # If this is set as default, unset other defaults (one UPDATE, same transaction as the insert)
     if plan.is_default:
-        existing = await db.execute(select(SubscriptionPlan).where(SubscriptionPlan.is_default == True))
-        for existing_plan in existing.scalars().all():
-            existing_plan.is_default = False
+        await db.execute(
+            update(SubscriptionPlan)
+            .where(SubscriptionPlan.is_default == True)
+            .values(is_default=False)
+        )
     
     new_plan = SubscriptionPlan(
         name=plan.name,
@@ -123,20 +156,10 @@ async def create_subscription_plan(
     
     db.add(new_plan)
     await db.commit()
-    await db.refresh(new_plan)
+    _PLAN_CACHE.clear()
+    invalidate_plans()
     
-    return SubscriptionPlanResponse(
-        id=new_plan.id,
-        name=new_plan.name,
-        description=new_plan.description,
-        price=new_plan.price,
-        duration_days=new_plan.duration_days,
-        features=new_plan.features or [],
-        is_active=new_plan.is_active,
-        is_default=new_plan.is_default,
-        created_by=new_plan.created_by,
-        created_at=new_plan.created_at
-    )
+    return SubscriptionPlanResponse.model_validate(new_plan)
 
 
 @router.put("/plans/{plan_id}", response_model=SubscriptionPlanResponse)
@@ -144,61 +167,46 @@ async def update_subscription_plan(
     plan_id: str,
     updates: SubscriptionPlanUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_super_admin)
 ):
     """Update a subscription plan. Super Admin only."""
-    if current_user.role != UserRole.SUPER_ADMIN:
-        raise HTTPException(status_code=403, detail="Only Super Admin can update subscription plans")
-    
-    result = await db.execute(select(SubscriptionPlan).where(SubscriptionPlan.id == plan_id))
-    plan = result.scalars().first()
+    plan = await db.get(SubscriptionPlan, plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="Subscription plan not found")
     
-    # If setting as default, unset other defaults
+    # If setting as default, unset other defaults (one UPDATE, same transaction as the change)
     if updates.is_default:
-        existing = await db.execute(select(SubscriptionPlan).where(SubscriptionPlan.is_default == True))
-        for existing_plan in existing.scalars().all():
-            if existing_plan.id != plan_id:
-                existing_plan.is_default = False
+        await db.execute(
+            update(SubscriptionPlan)
+            .where(SubscriptionPlan.is_default == True, SubscriptionPlan.id != plan_id)
+            .values(is_default=False)
+        )
     
     update_data = updates.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(plan, key, value)
     
     await db.commit()
-    await db.refresh(plan)
+    _PLAN_CACHE.clear()
+    invalidate_plans()
     
-    return SubscriptionPlanResponse(
-        id=plan.id,
-        name=plan.name,
-        description=plan.description,
-        price=plan.price,
-        duration_days=plan.duration_days,
-        features=plan.features or [],
-        is_active=plan.is_active,
-        is_default=plan.is_default,
-        created_by=plan.created_by,
-        created_at=plan.created_at
-    )
+    return SubscriptionPlanResponse.model_validate(plan)
 
 
 @router.delete("/plans/{plan_id}")
 async def delete_subscription_plan(
     plan_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    current_user: AuthSnapshot = Depends(get_current_super_admin)
 ):
     """Delete a subscription plan. Super Admin only."""
-    if current_user.role != UserRole.SUPER_ADMIN:
-        raise HTTPException(status_code=403, detail="Only Super Admin can delete subscription plans")
-    
-    result = await db.execute(select(SubscriptionPlan).where(SubscriptionPlan.id == plan_id))
-    plan = result.scalars().first()
+    plan = await db.get(SubscriptionPlan, plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="Subscription plan not found")
     
     await db.delete(plan)
     await db.commit()
+    _PLAN_CACHE.clear()
+    invalidate_plans()
     
     return {"message": "Subscription plan deleted successfully"}
@@ -11,28 +11,39 @@ NO UI-ONLY ACTIONS - Every button click persists.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import String, and_, cast, func, null, or_, true, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
 from datetime import datetime
 from typing import List, Optional
-import json
+import orjson
 
 from app.database import get_db
-from app.models.trust_flag import TrustFlag, TrustFlagType, TrustFlagStatus
+from app.models.trust_flag import TrustFlag, TrustFlagType, TrustFlagStatus, OPEN_FLAG_STATUSES
 from app.models.reminder import Reminder, ReminderType, ReminderStatus
 from app.models.audit_log import AuditLog, AuditActionType
 from app.models.reading_room import ReadingRoom
 from app.models.accommodation import Accommodation
 from app.models.user import User
+from app.services.audit_service import enqueue_audit
+from app.utils.venue_cache import VENUE_MODELS, get_venue_name
 
 # Trust status values (stored as strings in DB)
 TRUST_STATUS_CLEAR = "CLEAR"
 TRUST_STATUS_FLAGGED = "FLAGGED"
 TRUST_STATUS_UNDER_REVIEW = "UNDER_REVIEW"
 TRUST_STATUS_SUSPENDED = "SUSPENDED"
+
+# Flag statuses shared across queries (in_() binds them as one expanding parameter,
+# so every use compiles to the same cached statement); OPEN_FLAG_STATUSES lives with the model
+OWNER_VISIBLE_FLAG_STATUSES = OPEN_FLAG_STATUSES + (TrustFlagStatus.ESCALATED,)
 from pydantic import BaseModel
 
-router = APIRouter(prefix="/api/trust", tags=["Trust & Safety"])
+# orjson encodes datetimes and enums natively, so entries carry raw column values
+router = APIRouter(prefix="/api/trust", tags=["Trust & Safety"], default_response_class=ORJSONResponse)
 
 
 # ================== SCHEMAS ==================
@@ -65,8 +76,7 @@ class ReminderCreate(BaseModel):
 
 # ================== HELPER FUNCTIONS ==================
 
-async def log_audit(
-    db: AsyncSession,
+def log_audit(
     actor_id: str,
     actor_name: str,
     actor_role: str,
@@ -77,43 +87,88 @@ async def log_audit(
     entity_name: str = None,
     metadata: dict = None
 ):
-    """Create an immutable audit log entry."""
-    entry = AuditLog(
-        actor_id=actor_id,
-        actor_name=actor_name,
-        actor_role=actor_role,
-        action_type=action_type,
-        action_description=description,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        entity_name=entity_name,
-        extra_data=json.dumps(metadata) if metadata else None,
-        timestamp=datetime.utcnow()
-    )
-    db.add(entry)
-    await db.commit()
-    return entry
+    """
+    Queue an immutable audit log entry.
+    Written in batches by the background audit writer, so call it after the
+    action's commit has succeeded.
+    """
+    enqueue_audit({
+        "actor_id": actor_id,
+        "actor_name": actor_name,
+        "actor_role": actor_role,
+        "action_type": action_type,
+        "action_description": description,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "entity_name": entity_name,
+        "extra_data": metadata or None,
+        "timestamp": datetime.utcnow(),
+    })
+
+
+# Accommodation has no trust_status column today; checked once rather than per call
+_VENUE_TRUST_TABLES = {
+    "reading_room": ReadingRoom,
+    **({"accommodation": Accommodation} if "trust_status" in Accommodation.__table__.columns else {}),
+}
 
 
 async def update_venue_trust_status(db: AsyncSession, entity_type: str, entity_id: str, trust_status: str):
-    """Update venue trust status in the database."""
-    if entity_type == "reading_room":
-        result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == entity_id))
-        venue = result.scalars().first()
-        if venue:
-            venue.trust_status = trust_status
-            await db.commit()
-            return venue
-    elif entity_type == "accommodation":
-        result = await db.execute(select(Accommodation).where(Accommodation.id == entity_id))
-        venue = result.scalars().first()
-        if venue:
-            # Add trust_status to accommodation if exists
-            if hasattr(venue, 'trust_status'):
-                venue.trust_status = trust_status
-            await db.commit()
-            return venue
-    return None
+    """Set venue trust status with a single UPDATE; committed by the caller."""
+    model = _VENUE_TRUST_TABLES.get(entity_type)
+    if model is None:
+        return
+    await db.execute(
+        update(model).where(model.id == entity_id).values(trust_status=trust_status)
+    )
+
+
+# ================== LIST PROJECTIONS ==================
+# List endpoints select just the columns they serialize; Row objects support the
+# same attribute access as ORM instances, without hydration or identity-map work.
+
+FLAG_LIST_COLUMNS = (
+    TrustFlag.id, TrustFlag.entity_type, TrustFlag.entity_id, TrustFlag.entity_name,
+    TrustFlag.flag_type, TrustFlag.custom_reason, TrustFlag.raised_by, TrustFlag.raised_by_name,
+    TrustFlag.status, TrustFlag.resolution_notes, TrustFlag.resolved_by, TrustFlag.resolved_by_name,
+    TrustFlag.created_at, TrustFlag.updated_at, TrustFlag.resolved_at,
+    TrustFlag.owner_notes, TrustFlag.resubmitted_at,
+)
+
+REMINDER_LIST_COLUMNS = (
+    Reminder.id, Reminder.user_id, Reminder.user_name, Reminder.user_email,
+    Reminder.reminder_type, Reminder.missing_fields, Reminder.message,
+    Reminder.sent_by, Reminder.sent_by_name, Reminder.status,
+    Reminder.blocks_listings, Reminder.blocks_payments, Reminder.blocks_bookings,
+    Reminder.sent_at, Reminder.completed_at,
+)
+
+AUDIT_LIST_COLUMNS = (
+    AuditLog.id, AuditLog.actor_id, AuditLog.actor_name, AuditLog.actor_role,
+    AuditLog.action_type, AuditLog.action_description,
+    AuditLog.entity_type, AuditLog.entity_id, AuditLog.entity_name,
+    AuditLog.extra_data, AuditLog.timestamp,
+)
+
+
+# ================== LIST SERIALIZATION ==================
+# The *_LIST_COLUMNS tuples above are the response shape: each row serializes
+# as {column name: value} in that order, so a field is added in one place.
+
+_row_dict = Row._asdict
+
+
+async def _stream_json_array(rows, build_entry, head: bytes = b"", tail: bytes = b""):
+    """
+    Stream rows as a JSON array (optionally wrapped by head/tail bytes), encoding
+    one entry at a time with orjson so the dicts and the encoded body never all
+    sit in memory together.
+    """
+    yield head + b"["
+    for i, row in enumerate(rows):
+        entry = orjson.dumps(build_entry(row))
+        yield b"," + entry if i else entry
+    yield b"]" + tail
 
 
 # ================== FLAG ENDPOINTS ==================
@@ -125,7 +180,7 @@ async def get_all_flags(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all trust flags with optional filters."""
-    query = select(TrustFlag)
+    query = select(*FLAG_LIST_COLUMNS)
     
     if status:
         query = query.where(TrustFlag.status == status)
@@ -134,31 +189,9 @@ async def get_all_flags(
     
     query = query.order_by(TrustFlag.created_at.desc())
     result = await db.execute(query)
-    flags = result.scalars().all()
+    flags = result.all()
     
-    # Convert to dict for JSON response
-    return [
-        {
-            "id": f.id,
-            "entity_type": f.entity_type,
-            "entity_id": f.entity_id,
-            "entity_name": f.entity_name,
-            "flag_type": str(f.flag_type.value) if f.flag_type else None,
-            "custom_reason": f.custom_reason,
-            "raised_by": f.raised_by,
-            "raised_by_name": f.raised_by_name,
-            "status": str(f.status.value) if f.status else None,
-            "resolution_notes": f.resolution_notes,
-            "resolved_by": f.resolved_by,
-            "resolved_by_name": f.resolved_by_name,
-            "created_at": f.created_at.isoformat() if f.created_at else None,
-            "updated_at": f.updated_at.isoformat() if f.updated_at else None,
-            "resolved_at": f.resolved_at.isoformat() if f.resolved_at else None,
-            "owner_notes": f.owner_notes,
-            "resubmitted_at": f.resubmitted_at.isoformat() if f.resubmitted_at else None
-        }
-        for f in flags
-    ]
+    return StreamingResponse(_stream_json_array(flags, _row_dict), media_type="application/json")
 
 
 @router.post("/flags")
@@ -174,33 +207,12 @@ async def create_flag(
     - Logs to audit trail
     - Returns created flag
     """
-    # Get entity name for display
-    entity_name = None
-    if data.entity_type == "reading_room":
-        result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == data.entity_id))
-        venue = result.scalars().first()
-        if venue:
-            entity_name = venue.name
-    elif data.entity_type == "accommodation":
-        result = await db.execute(select(Accommodation).where(Accommodation.id == data.entity_id))
-        venue = result.scalars().first()
-        if venue:
-            entity_name = venue.name
+    # Get entity name for display (memoized; also confirms the venue exists)
+    entity_name = await get_venue_name(db, data.entity_type, data.entity_id)
     
     if not entity_name:
         raise HTTPException(status_code=404, detail="Entity not found")
     
-    # Check for existing active flag
-    existing_query = select(TrustFlag).where(
-        TrustFlag.entity_id == data.entity_id,
-        TrustFlag.status.in_([TrustFlagStatus.ACTIVE, TrustFlagStatus.OWNER_RESUBMITTED])
-    )
-    existing_result = await db.execute(existing_query)
-    existing = existing_result.scalars().first()
-    
-    if existing:
-        raise HTTPException(status_code=400, detail="Active flag already exists for this entity")
-    
     # Create flag
     flag = TrustFlag(
         entity_type=data.entity_type,
@@ -213,16 +225,19 @@ async def create_flag(
         status=TrustFlagStatus.ACTIVE
     )
     db.add(flag)
+    # uq_trust_flags_open_entity rejects a second open flag on the same entity
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Active flag already exists for this entity")
     
     # Update venue trust status
     await update_venue_trust_status(db, data.entity_type, data.entity_id, TRUST_STATUS_FLAGGED)
     
     await db.commit()
-    await db.refresh(flag)
     
-    # Log audit
-    await log_audit(
-        db=db,
+    log_audit(
         actor_id=actor_id,
         actor_name=actor_name,
         actor_role="SUPER_ADMIN",
@@ -291,11 +306,8 @@ async def resolve_flag(
         raise HTTPException(status_code=400, detail="Invalid action")
     
     await db.commit()
-    await db.refresh(flag)
     
-    # Log audit
-    await log_audit(
-        db=db,
+    log_audit(
         actor_id=actor_id,
         actor_name=actor_name,
         actor_role="SUPER_ADMIN",
@@ -337,11 +349,8 @@ async def owner_resubmit(
     await update_venue_trust_status(db, flag.entity_type, flag.entity_id, TRUST_STATUS_UNDER_REVIEW)
     
     await db.commit()
-    await db.refresh(flag)
     
-    # Log audit
-    await log_audit(
-        db=db,
+    log_audit(
         actor_id=owner_id,
         actor_name=owner_name,
         actor_role="ADMIN",
@@ -387,11 +396,8 @@ async def reinstate_flag(
     await update_venue_trust_status(db, flag.entity_type, flag.entity_id, TRUST_STATUS_CLEAR)
     
     await db.commit()
-    await db.refresh(flag)
     
-    # Log audit
-    await log_audit(
-        db=db,
+    log_audit(
         actor_id=actor_id,
         actor_name=actor_name,
         actor_role="SUPER_ADMIN",
@@ -412,48 +418,22 @@ async def get_owner_flags(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all flags for venues owned by this owner."""
-    # Get owner's venue IDs
-    room_result = await db.execute(select(ReadingRoom.id).where(ReadingRoom.owner_id == owner_id))
-    room_ids = room_result.scalars().all()
-    
-    acc_result = await db.execute(select(Accommodation.id).where(Accommodation.owner_id == owner_id))
-    acc_ids = acc_result.scalars().all()
-    
-    all_entity_ids = list(room_ids) + list(acc_ids)
-    
-    if not all_entity_ids:
-        return []
+    # Owner's venues as subqueries - ownership is resolved in the same statement
+    owned_rooms = select(ReadingRoom.id).where(ReadingRoom.owner_id == owner_id)
+    owned_accs = select(Accommodation.id).where(Accommodation.owner_id == owner_id)
     
     # Include ESCALATED flags - owner must see suspended venues
-    query = select(TrustFlag).where(
-        TrustFlag.entity_id.in_(all_entity_ids),
-        TrustFlag.status.in_([TrustFlagStatus.ACTIVE, TrustFlagStatus.OWNER_RESUBMITTED, TrustFlagStatus.ESCALATED])
+    query = select(*FLAG_LIST_COLUMNS).where(
+        or_(
+            and_(TrustFlag.entity_type == "reading_room", TrustFlag.entity_id.in_(owned_rooms)),
+            and_(TrustFlag.entity_type == "accommodation", TrustFlag.entity_id.in_(owned_accs))
+        ),
+        TrustFlag.status.in_(OWNER_VISIBLE_FLAG_STATUSES)
     ).order_by(TrustFlag.created_at.desc())
     result = await db.execute(query)
-    flags = result.scalars().all()
+    flags = result.all()
     
-    return [
-        {
-            "id": f.id,
-            "entity_type": f.entity_type,
-            "entity_id": f.entity_id,
-            "entity_name": f.entity_name,
-            "flag_type": str(f.flag_type.value) if f.flag_type else None,
-            "custom_reason": f.custom_reason,
-            "raised_by": f.raised_by,
-            "raised_by_name": f.raised_by_name,
-            "status": str(f.status.value) if f.status else None,
-            "resolution_notes": f.resolution_notes,
-            "resolved_by": f.resolved_by,
-            "resolved_by_name": f.resolved_by_name,
-            "created_at": f.created_at.isoformat() if f.created_at else None,
-            "updated_at": f.updated_at.isoformat() if f.updated_at else None,
-            "resolved_at": f.resolved_at.isoformat() if f.resolved_at else None,
-            "owner_notes": f.owner_notes,
-            "resubmitted_at": f.resubmitted_at.isoformat() if f.resubmitted_at else None
-        }
-        for f in flags
-    ]
+    return list(map(_row_dict, flags))
 
 
 # ================== REMINDER ENDPOINTS ==================
@@ -464,35 +444,16 @@ async def get_all_reminders(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all reminders with optional status filter."""
-    query = select(Reminder)
+    query = select(*REMINDER_LIST_COLUMNS)
     
     if status:
         query = query.where(Reminder.status == status)
     
     query = query.order_by(Reminder.sent_at.desc())
     result = await db.execute(query)
-    reminders = result.scalars().all()
+    reminders = result.all()
     
-    return [
-        {
-            "id": r.id,
-            "user_id": r.user_id,
-            "user_name": r.user_name,
-            "user_email": r.user_email,
-            "reminder_type": str(r.reminder_type.value) if r.reminder_type else None,
-            "missing_fields": r.missing_fields,
-            "message": r.message,
-            "sent_by": r.sent_by,
-            "sent_by_name": r.sent_by_name,
-            "status": str(r.status.value) if r.status else None,
-            "blocks_listings": r.blocks_listings,
-            "blocks_payments": r.blocks_payments,
-            "blocks_bookings": r.blocks_bookings,
-            "sent_at": r.sent_at.isoformat() if r.sent_at else None,
-            "completed_at": r.completed_at.isoformat() if r.completed_at else None
-        }
-        for r in reminders
-    ]
+    return StreamingResponse(_stream_json_array(reminders, _row_dict), media_type="application/json")
 
 
 @router.post("/reminders")
@@ -511,18 +472,6 @@ async def send_reminder(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Check for existing pending reminder of same type
-    existing_query = select(Reminder).where(
-        Reminder.user_id == data.user_id,
-        Reminder.reminder_type == data.reminder_type,
-        Reminder.status == ReminderStatus.PENDING
-    )
-    existing_result = await db.execute(existing_query)
-    existing = existing_result.scalars().first()
-    
-    if existing:
-        raise HTTPException(status_code=400, detail="Pending reminder of this type already exists")
-    
     # Create reminder
     reminder = Reminder(
         user_id=data.user_id,
@@ -539,12 +488,15 @@ async def send_reminder(
         status=ReminderStatus.PENDING
     )
     db.add(reminder)
+    # uq_reminders_pending_user_type rejects a second pending reminder of the same type
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Pending reminder of this type already exists")
     await db.commit()
-    await db.refresh(reminder)
     
-    # Log audit
-    await log_audit(
-        db=db,
+    log_audit(
         actor_id=actor_id,
         actor_name=actor_name,
         actor_role="SUPER_ADMIN",
@@ -578,11 +530,8 @@ async def complete_reminder(
     reminder.completed_at = datetime.utcnow()
     
     await db.commit()
-    await db.refresh(reminder)
     
-    # Log audit
-    await log_audit(
-        db=db,
+    log_audit(
         actor_id=user_id,
         actor_name=reminder.user_name,
         actor_role="USER",
@@ -604,19 +553,23 @@ async def get_user_reminders(
 ):
     """Get all reminders for a specific user."""
     result = await db.execute(
-        select(Reminder).where(Reminder.user_id == user_id).order_by(Reminder.sent_at.desc())
+        select(
+            Reminder.id, Reminder.reminder_type, Reminder.status,
+            Reminder.blocks_listings, Reminder.blocks_payments, Reminder.blocks_bookings,
+            Reminder.sent_at
+        ).where(Reminder.user_id == user_id).order_by(Reminder.sent_at.desc())
     )
-    reminders = result.scalars().all()
+    reminders = result.all()
     
     return [
         {
             "id": r.id,
-            "reminder_type": str(r.reminder_type.value) if r.reminder_type else None,
-            "status": str(r.status.value) if r.status else None,
+            "reminder_type": r.reminder_type,
+            "status": r.status,
             "blocks_listings": r.blocks_listings,
             "blocks_payments": r.blocks_payments,
             "blocks_bookings": r.blocks_bookings,
-            "sent_at": r.sent_at.isoformat() if r.sent_at else None
+            "sent_at": r.sent_at
         }
         for r in reminders
     ]
@@ -628,24 +581,30 @@ async def check_user_blocks(
     db: AsyncSession = Depends(get_db)
 ):
     """Check if user has any active blocks from reminders."""
-    result = await db.execute(
-        select(Reminder).where(
+    # One aggregate row over the user's pending reminders
+    # (FILTER counts stand in for bool_or, which SQLite lacks)
+    pending, listings, payments, bookings, types = (await db.execute(
+        select(
+            func.count(),
+            func.count().filter(Reminder.blocks_listings == true()),
+            func.count().filter(Reminder.blocks_payments == true()),
+            func.count().filter(Reminder.blocks_bookings == true()),
+            func.aggregate_strings(cast(Reminder.reminder_type, String), ",")
+        ).where(
             Reminder.user_id == user_id,
             Reminder.status == ReminderStatus.PENDING
         )
-    )
-    pending_reminders = result.scalars().all()
-    
-    blocks = {
-        "has_blocks": len(pending_reminders) > 0,
-        "blocks_listings": any(r.blocks_listings for r in pending_reminders),
-        "blocks_payments": any(r.blocks_payments for r in pending_reminders),
-        "blocks_bookings": any(r.blocks_bookings for r in pending_reminders),
-        "pending_reminders": len(pending_reminders),
-        "reminder_types": [str(r.reminder_type.value) for r in pending_reminders if r.reminder_type]
-    }
+    )).one()
     
-    return blocks
+    # Enum columns are stored by member name; the API reports values
+    return {
+        "has_blocks": pending > 0,
+        "blocks_listings": listings > 0,
+        "blocks_payments": payments > 0,
+        "blocks_bookings": bookings > 0,
+        "pending_reminders": pending,
+        "reminder_types": [ReminderType[name].value for name in types.split(",")] if types else []
+    }
 
 
 # ================== AUDIT LOG ENDPOINTS ==================
@@ -665,54 +624,33 @@ async def get_audit_log(
     Get audit log entries with filters.
     Read-only - no updates or deletes allowed.
     """
-    query = select(AuditLog)
-    
+    filters = []
     if start_date:
-        query = query.where(AuditLog.timestamp >= datetime.fromisoformat(start_date))
+        filters.append(AuditLog.timestamp >= datetime.fromisoformat(start_date))
     if end_date:
-        query = query.where(AuditLog.timestamp <= datetime.fromisoformat(end_date))
+        filters.append(AuditLog.timestamp <= datetime.fromisoformat(end_date))
     if actor_id:
-        query = query.where(AuditLog.actor_id == actor_id)
+        filters.append(AuditLog.actor_id == actor_id)
     if action_type:
-        query = query.where(AuditLog.action_type == action_type)
+        filters.append(AuditLog.action_type == action_type)
     if entity_type:
-        query = query.where(AuditLog.entity_type == entity_type)
+        filters.append(AuditLog.entity_type == entity_type)
     
-    # Count total
-    count_query = select(AuditLog)
-    if action_type:
-        count_query = count_query.where(AuditLog.action_type == action_type)
-    if entity_type:
-        count_query = count_query.where(AuditLog.entity_type == entity_type)
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    # Count total (same filters as the page, counted in SQL)
+    total = await db.scalar(select(func.count()).select_from(AuditLog).where(*filters))
     
     # Get entries with pagination
-    query = query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit)
+    query = select(*AUDIT_LIST_COLUMNS).where(*filters).order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit)
     result = await db.execute(query)
-    entries = result.scalars().all()
-    
-    return {
-        "total": total,
-        "entries": [
-            {
-                "id": e.id,
-                "actor_id": e.actor_id,
-                "actor_name": e.actor_name,
-                "actor_role": e.actor_role,
-                "action_type": str(e.action_type.value) if e.action_type else None,
-                "action_description": e.action_description,
-                "entity_type": e.entity_type,
-                "entity_id": e.entity_id,
-                "entity_name": e.entity_name,
-                "extra_data": e.extra_data,
-                "timestamp": e.timestamp.isoformat() if e.timestamp else None
-            }
-            for e in entries
-        ],
-        "limit": limit,
-        "offset": offset
-    }
+    entries = result.all()
+    
+    # Body shape: {"total", "entries": [...], "limit", "offset"}
+    head = b'{"total":' + orjson.dumps(total) + b',"entries":'
+    tail = b',"limit":' + orjson.dumps(limit) + b',"offset":' + orjson.dumps(offset) + b'}'
+    return StreamingResponse(
+        _stream_json_array(entries, _row_dict, head=head, tail=tail),
+        media_type="application/json"
+    )
 
 
 @router.get("/audit-log/entity/{entity_type}/{entity_id}")
@@ -723,23 +661,17 @@ async def get_entity_audit_log(
 ):
     """Get audit log for a specific entity (for owner view)."""
     result = await db.execute(
-        select(AuditLog).where(
+        select(
+            AuditLog.id, AuditLog.actor_name, AuditLog.action_type,
+            AuditLog.action_description, AuditLog.timestamp
+        ).where(
             AuditLog.entity_type == entity_type,
             AuditLog.entity_id == entity_id
         ).order_by(AuditLog.timestamp.desc())
     )
-    entries = result.scalars().all()
+    entries = result.all()
     
-    return [
-        {
-            "id": e.id,
-            "actor_name": e.actor_name,
-            "action_type": str(e.action_type.value) if e.action_type else None,
-            "action_description": e.action_description,
-            "timestamp": e.timestamp.isoformat() if e.timestamp else None
-        }
-        for e in entries
-    ]
+    return list(map(_row_dict, entries))
 
 
 # ================== VENUE TRUST STATUS ==================
@@ -751,37 +683,43 @@ async def get_venue_trust_status(
     db: AsyncSession = Depends(get_db)
 ):
     """Get trust status for a venue, including any active flags."""
-    # Get venue
-    venue = None
-    if entity_type == "reading_room":
-        result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == entity_id))
-        venue = result.scalars().first()
-    elif entity_type == "accommodation":
-        result = await db.execute(select(Accommodation).where(Accommodation.id == entity_id))
-        venue = result.scalars().first()
-    
-    if not venue:
+    model = VENUE_MODELS.get(entity_type)
+    if model is None:
         raise HTTPException(status_code=404, detail="Venue not found")
     
-    # Get active flags
-    flag_result = await db.execute(
-        select(TrustFlag).where(
-            TrustFlag.entity_id == entity_id,
-            TrustFlag.status.in_([TrustFlagStatus.ACTIVE, TrustFlagStatus.OWNER_RESUBMITTED])
+    # Venue row LEFT JOIN its open flags: one round-trip, one row per flag (or one with NULLs)
+    trust_col = model.trust_status if "trust_status" in model.__table__.columns else null()
+    rows = (await db.execute(
+        select(
+            model.name.label("venue_name"),
+            trust_col.label("trust_status"),
+            TrustFlag.id,
+            TrustFlag.flag_type,
+            TrustFlag.status
         )
-    )
-    active_flags = flag_result.scalars().all()
+        .outerjoin(TrustFlag, and_(
+            TrustFlag.entity_id == model.id,
+            TrustFlag.status.in_(OPEN_FLAG_STATUSES)
+        ))
+        .where(model.id == entity_id)
+    )).all()
+    
+    if not rows:
+        raise HTTPException(status_code=404, detail="Venue not found")
+    
+    venue = rows[0]
+    active_flags = [row for row in rows if row.id is not None]
     
-    trust_status = getattr(venue, 'trust_status', TRUST_STATUS_CLEAR) or TRUST_STATUS_CLEAR
+    trust_status = venue.trust_status or TRUST_STATUS_CLEAR
     
     return {
         "entity_id": entity_id,
         "entity_type": entity_type,
-        "entity_name": venue.name,
+        "entity_name": venue.venue_name,
         "trust_status": trust_status,
         "is_flagged": len(active_flags) > 0,
         "active_flags": [
-            {"id": f.id, "flag_type": str(f.flag_type.value) if f.flag_type else None, "status": str(f.status.value) if f.status else None}
+            {"id": f.id, "flag_type": f.flag_type, "status": f.status}
             for f in active_flags
         ],
         "can_promote": trust_status == TRUST_STATUS_CLEAR,
@@ -1,27 +1,45 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
 from sqlalchemy.future import select
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.schemas.user import UserResponse, AdminUserUpdate
-from app.deps import get_current_super_admin, get_current_user
+from app.deps import AuthSnapshot, get_current_super_admin, get_current_user, invalidate_cached_user
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Page size bounds for the admin user list
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
 @router.get("/", response_model=List[UserResponse])
 async def get_all_users(
+    response: Response,
     role: Optional[UserRole] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_super_admin)
+    current_user: AuthSnapshot = Depends(get_current_super_admin)
 ):
+    """
+    Users ordered by id, keyset-paginated: pass the X-Next-Cursor header
+    value back as after_id for the next page (absent on the last page).
+    """
     query = select(User)
     
     if role:
         query = query.where(User.role == role)
+    if after_id:
+        query = query.where(User.id > after_id)
         
-    result = await db.execute(query)
-    users = result.scalars().all()
+    result = await db.execute(query.order_by(User.id).limit(limit + 1))
+    users = list(result.scalars().all())
+    if len(users) > limit:
+        del users[limit:]
+        response.headers["X-Next-Cursor"] = users[-1].id
     return users
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -48,21 +66,26 @@ async def update_user(
     user_id: str,
     updates: AdminUserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_super_admin)
+    current_user: AuthSnapshot = Depends(get_current_super_admin)
 ):
     """Update user details. Super Admin only."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+    update_data = updates.model_dump(exclude_unset=True)
+    if not update_data:
+        user = await db.get(User, user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        return user
     
+    # Single UPDATE ... RETURNING instead of load, mutate, commit, refresh
+    result = await db.execute(
+        update(User).where(User.id == user_id).values(**update_data).returning(User)
+    )
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    # Update fields that are provided
-    update_data = updates.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(user, field, value)
-    
     await db.commit()
-    await db.refresh(user)
+    
+    # Role/email changed - don't keep serving the memoized role snapshot
+    invalidate_cached_user(user.id)
     
     return user
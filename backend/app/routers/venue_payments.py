@@ -5,16 +5,18 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from typing import List, Optional, Union
+from datetime import datetime, timezone
+import orjson
 
 from app.database import get_db
 from app.models.reading_room import ReadingRoom, ListingStatus
 from app.models.accommodation import Accommodation
-from app.models.subscription_plan import SubscriptionPlan
 from app.models.user import User
 from app.services.payment_service import payment_service
 from app.deps import get_current_user
+from app.utils.plan_cache import get_plan
+from app.utils.venue_cache import VENUE_MODELS
 
 router = APIRouter(prefix="/payments/venue", tags=["Venue Payments"])
 
@@ -43,6 +45,53 @@ class VerifyVenuePaymentRequest(BaseModel):
     subscription_plan_id: str
 
 
+async def _get_owned_venue(
+    db: AsyncSession, venue_type: str, venue_id: str, owner_id: str
+) -> Optional[Union[ReadingRoom, Accommodation]]:
+    """The owner's reading room / accommodation, or None if missing, not theirs or venue_type is unknown"""
+    model = VENUE_MODELS.get(venue_type)
+    if model is None:
+        return None
+    return await db.scalar(
+        select(model).where(model.id == venue_id, model.owner_id == owner_id)
+    )
+
+
+MIN_VENUE_IMAGES = 4
+
+
+def _validate_venue(venue: Union[ReadingRoom, Accommodation]) -> List[str]:
+    """Names of the listing details still missing before a venue can be submitted"""
+    errors = []
+    if not venue.name: errors.append("Name")
+    if not venue.address: errors.append("Address")
+    if not venue.city: errors.append("City")
+    if not venue.contact_phone: errors.append("Phone")
+    
+    # Reading rooms load images as a list; accommodations still store a JSON string
+    imgs = venue.images
+    if isinstance(imgs, str):
+        try:
+            imgs = orjson.loads(imgs)
+        except orjson.JSONDecodeError:
+            imgs = None
+    if not isinstance(imgs, list) or len(imgs) < MIN_VENUE_IMAGES:
+        errors.append(f"Minimum {MIN_VENUE_IMAGES} Images")
+    
+    return errors
+
+
+def _mark_submitted(
+    venue: Union[ReadingRoom, Accommodation], plan_id: str, payment_id: str, now: datetime
+) -> None:
+    """Move a paid venue to VERIFICATION_PENDING and record the payment"""
+    venue.status = ListingStatus.VERIFICATION_PENDING
+    venue.subscription_plan_id = plan_id
+    venue.payment_id = payment_id
+    # Accommodations keep payment_date in a String column
+    venue.payment_date = now.isoformat() if isinstance(venue, Accommodation) else now
+
+
 @router.post("/create-order", response_model=CreateVenueOrderResponse)
 async def create_venue_payment_order(
     request: CreateVenueOrderRequest,
@@ -53,35 +102,13 @@ async def create_venue_payment_order(
     Create a Razorpay order for venue subscription payment
     """
     # Verify subscription plan exists and is active
-    plan_result = await db.execute(
-        select(SubscriptionPlan).where(
-            SubscriptionPlan.id == request.subscription_plan_id,
-            SubscriptionPlan.is_active == True
-        )
-    )
-    plan = plan_result.scalar_one_or_none()
+    plan = await get_plan(db, request.subscription_plan_id)
     
-    if not plan:
+    if not plan or not plan.is_active:
         raise HTTPException(status_code=404, detail="Subscription plan not found or inactive")
     
     # Verify venue exists and belongs to user
-    venue = None
-    if request.venue_type == 'reading_room':
-        venue_result = await db.execute(
-            select(ReadingRoom).where(
-                ReadingRoom.id == request.venue_id,
-                ReadingRoom.owner_id == current_user.id
-            )
-        )
-        venue = venue_result.scalar_one_or_none()
-    elif request.venue_type == 'accommodation':
-        venue_result = await db.execute(
-            select(Accommodation).where(
-                Accommodation.id == request.venue_id,
-                Accommodation.owner_id == current_user.id
-            )
-        )
-        venue = venue_result.scalar_one_or_none()
+    venue = await _get_owned_venue(db, request.venue_type, request.venue_id, current_user.id)
     
     if not venue:
         raise HTTPException(status_code=404, detail="Venue not found or not authorized")
@@ -140,57 +167,19 @@ async def verify_venue_payment(
         raise HTTPException(status_code=400, detail="Invalid payment signature")
     
     # Verify subscription plan
-    plan_result = await db.execute(
-        select(SubscriptionPlan).where(SubscriptionPlan.id == request.subscription_plan_id)
-    )
-    plan = plan_result.scalar_one_or_none()
+    plan = await get_plan(db, request.subscription_plan_id)
     
     if not plan:
         raise HTTPException(status_code=404, detail="Subscription plan not found")
     
     # Get venue and update status
-    venue = None
-    if request.venue_type == 'reading_room':
-        venue_result = await db.execute(
-            select(ReadingRoom).where(
-                ReadingRoom.id == request.venue_id,
-                ReadingRoom.owner_id == current_user.id
-            )
-        )
-        venue = venue_result.scalar_one_or_none()
-    elif request.venue_type == 'accommodation':
-        venue_result = await db.execute(
-            select(Accommodation).where(
-                Accommodation.id == request.venue_id,
-                Accommodation.owner_id == current_user.id
-            )
-        )
-        venue = venue_result.scalar_one_or_none()
+    venue = await _get_owned_venue(db, request.venue_type, request.venue_id, current_user.id)
     
     if not venue:
         raise HTTPException(status_code=404, detail="Venue not found")
     
     # Validate venue data before marking as paid
-    errors = []
-    if not venue.name: errors.append("Name")
-    if not venue.address: errors.append("Address")
-    if not venue.city: errors.append("City")
-    if not venue.contact_phone: errors.append("Phone")
-    
-    # Image validation
-    import json
-    valid_images = False
-    if venue.images:
-        try:
-            imgs = json.loads(venue.images)
-            if isinstance(imgs, list) and len(imgs) >= 4:
-                valid_images = True
-        except:
-            pass
-    
-    if not valid_images:
-        errors.append("Minimum 4 Images")
-    
+    errors = _validate_venue(venue)
     if errors:
         raise HTTPException(
             status_code=400, 
@@ -198,20 +187,10 @@ async def verify_venue_payment(
         )
     
     # Update venue status to VERIFICATION_PENDING
-    venue.status = ListingStatus.VERIFICATION_PENDING
-    venue.subscription_plan_id = request.subscription_plan_id
-    venue.payment_id = request.razorpay_payment_id
-    venue.payment_date = datetime.utcnow()
+    _mark_submitted(venue, request.subscription_plan_id, request.razorpay_payment_id, datetime.now(timezone.utc))
     
     await db.commit()
     
-    # Fetch payment details
-    try:
-        payment_info = payment_service.fetch_payment(request.razorpay_payment_id)
-    except Exception as e:
-        print(f"Could not fetch payment info: {e}")
-        payment_info = {"amount": 0, "method": "card"}
-    
     return {
         "message": "Payment verified successfully. Venue submitted for admin approval.",
         "venue_id": request.venue_id,
@@ -221,7 +200,9 @@ async def verify_venue_payment(
             "name": plan.name,
             "duration_days": plan.duration_days
         },
-        "amount": payment_info.get("amount", 0) / 100  # Convert paise to rupees
+        # Plan list price; the signature check above already proves the payment, so the
+        # captured amount (incl. GST) isn't re-fetched from Razorpay on the request path
+        "amount": plan.price
     }
 
 
@@ -235,57 +216,19 @@ async def dev_bypass_payment(
     DEVELOPMENT ONLY: Bypass payment gateway and mark venue as paid
     """
     # Verify subscription plan
-    plan_result = await db.execute(
-        select(SubscriptionPlan).where(SubscriptionPlan.id == request.subscription_plan_id)
-    )
-    plan = plan_result.scalar_one_or_none()
+    plan = await get_plan(db, request.subscription_plan_id)
     
     if not plan:
         raise HTTPException(status_code=404, detail="Subscription plan not found")
     
     # Get venue and update status
-    venue = None
-    if request.venue_type == 'reading_room':
-        venue_result = await db.execute(
-            select(ReadingRoom).where(
-                ReadingRoom.id == request.venue_id,
-                ReadingRoom.owner_id == current_user.id
-            )
-        )
-        venue = venue_result.scalar_one_or_none()
-    elif request.venue_type == 'accommodation':
-        venue_result = await db.execute(
-            select(Accommodation).where(
-                Accommodation.id == request.venue_id,
-                Accommodation.owner_id == current_user.id
-            )
-        )
-        venue = venue_result.scalar_one_or_none()
+    venue = await _get_owned_venue(db, request.venue_type, request.venue_id, current_user.id)
     
     if not venue:
         raise HTTPException(status_code=404, detail="Venue not found")
     
     # Validate venue data
-    errors = []
-    if not venue.name: errors.append("Name")
-    if not venue.address: errors.append("Address")
-    if not venue.city: errors.append("City")
-    if not venue.contact_phone: errors.append("Phone")
-    
-    # Image validation
-    import json
-    valid_images = False
-    if venue.images:
-        try:
-            imgs = json.loads(venue.images)
-            if isinstance(imgs, list) and len(imgs) >= 4:
-                valid_images = True
-        except:
-            pass
-    
-    if not valid_images:
-        errors.append("Minimum 4 Images")
-    
+    errors = _validate_venue(venue)
     if errors:
         raise HTTPException(
             status_code=400, 
@@ -293,10 +236,8 @@ async def dev_bypass_payment(
         )
     
     # Update venue status to VERIFICATION_PENDING
-    venue.status = ListingStatus.VERIFICATION_PENDING
-    venue.subscription_plan_id = request.subscription_plan_id
-    venue.payment_id = f"dev_bypass_{datetime.utcnow().timestamp()}"
-    venue.payment_date = datetime.utcnow()
+    now = datetime.now(timezone.utc)
+    _mark_submitted(venue, request.subscription_plan_id, f"dev_bypass_{now.timestamp()}", now)
     
     await db.commit()
     
@@ -321,23 +262,7 @@ async def get_venue_payment_status(
     """
     Get payment status for a venue
     """
-    venue = None
-    if venue_type == 'reading_room':
-        venue_result = await db.execute(
-            select(ReadingRoom).where(
-                ReadingRoom.id == venue_id,
-                ReadingRoom.owner_id == current_user.id
-            )
-        )
-        venue = venue_result.scalar_one_or_none()
-    elif venue_type == 'accommodation':
-        venue_result = await db.execute(
-            select(Accommodation).where(
-                Accommodation.id == venue_id,
-                Accommodation.owner_id == current_user.id
-            )
-        )
-        venue = venue_result.scalar_one_or_none()
+    venue = await _get_owned_venue(db, venue_type, venue_id, current_user.id)
     
     if not venue:
         raise HTTPException(status_code=404, detail="Venue not found")
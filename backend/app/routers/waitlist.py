@@ -1,16 +1,39 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.database import get_db
-from app.models.waitlist import WaitlistEntry, WaitlistStatus
-from app.models.reading_room import Cabin, CabinStatus
+from app.models.waitlist import WaitlistEntry, WaitlistStatus, OPEN_WAITLIST_STATUSES
+from app.models.booking import Booking, BookingStatus
+from app.models.reading_room import ReadingRoom, Cabin, CabinStatus
 from app.schemas.waitlist import WaitlistEntryCreate, WaitlistEntryResponse
 from app.models.user import User
 from app.deps import get_current_user
+from app.services.waitlist_service import notify_next_in_waitlist
 
 router = APIRouter(prefix="/waitlist", tags=["waitlist"])
 
+
+def _waitlist_response(entry: WaitlistEntry, **enrichment) -> WaitlistEntryResponse:
+    """
+    Response model built straight from a loaded row plus joined details.
+    model_construct skips re-validating columns that already have the right types;
+    the response_model still governs what is serialized.
+    """
+    return WaitlistEntryResponse.model_construct(
+        id=entry.id,
+        cabin_id=entry.cabin_id,
+        reading_room_id=entry.reading_room_id,
+        user_id=entry.user_id,
+        created_at=entry.created_at,
+        status=entry.status.value,
+        notified_at=entry.notified_at,
+        expires_at=entry.expires_at,
+        **enrichment
+    )
+
 @router.post("/", response_model=WaitlistEntryResponse)
 async def join_waitlist(
     entry: WaitlistEntryCreate,
@@ -27,9 +50,6 @@ async def join_waitlist(
         raise HTTPException(status_code=400, detail="Cabin is available, you can book it directly")
 
     # Check if user has an ACTIVE booking for this cabin
-    from app.models.booking import Booking, BookingStatus, PaymentStatus
-    from datetime import datetime
-    
     current_time = datetime.utcnow()
     
     active_booking = await db.execute(select(Booking).where(
@@ -46,13 +66,12 @@ async def join_waitlist(
     existing = await db.execute(select(WaitlistEntry).where(
         (WaitlistEntry.user_id == current_user.id) & 
         (WaitlistEntry.cabin_id == entry.cabin_id) &
-        (WaitlistEntry.status.in_([WaitlistStatus.ACTIVE, WaitlistStatus.NOTIFIED]))
+        (WaitlistEntry.status.in_(OPEN_WAITLIST_STATUSES))
     ))
     if existing.scalars().first():
         raise HTTPException(status_code=400, detail="You are already on the waitlist for this cabin")
 
     # Get reading room for owner_id
-    from app.models.reading_room import ReadingRoom
     rr_result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == entry.reading_room_id))
     reading_room = rr_result.scalars().first()
 
@@ -73,17 +92,37 @@ async def get_my_waitlists(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    from app.models.reading_room import ReadingRoom
-    from sqlalchemy import func
     
-    # Join with ReadingRoom and Cabin to get details
+    # Queue position per open entry, ranked within the cabins this user waits on.
+    # rank() = 1 + open entries created strictly earlier, so ties share a position.
+    user_cabins = select(WaitlistEntry.cabin_id).where(
+        WaitlistEntry.user_id == current_user.id,
+        WaitlistEntry.status.in_(OPEN_WAITLIST_STATUSES)
+    )
+    ranked = (
+        select(
+            WaitlistEntry.id,
+            func.rank().over(
+                partition_by=WaitlistEntry.cabin_id,
+                order_by=WaitlistEntry.created_at
+            ).label("position")
+        )
+        .where(
+            WaitlistEntry.cabin_id.in_(user_cabins),
+            WaitlistEntry.status.in_(OPEN_WAITLIST_STATUSES)
+        )
+        .cte("ranked")
+    )
+    
+    # Join with ReadingRoom and Cabin to get details - one round-trip for everything
     query = (
-        select(WaitlistEntry, ReadingRoom, Cabin)
+        select(WaitlistEntry, ReadingRoom, Cabin, ranked.c.position)
+        .join(ranked, ranked.c.id == WaitlistEntry.id)
         .join(ReadingRoom, WaitlistEntry.reading_room_id == ReadingRoom.id)
         .join(Cabin, WaitlistEntry.cabin_id == Cabin.id)
         .where(
             WaitlistEntry.user_id == current_user.id,
-            WaitlistEntry.status.in_([WaitlistStatus.ACTIVE, WaitlistStatus.NOTIFIED])
+            WaitlistEntry.status.in_(OPEN_WAITLIST_STATUSES)
         )
         .order_by(WaitlistEntry.created_at.desc())
     )
@@ -92,28 +131,15 @@ async def get_my_waitlists(
     rows = result.all()
     
     response = []
-    for entry, room, cabin in rows:
-        # Convert to Pydantic model
-        entry_data = WaitlistEntryResponse.model_validate(entry)
-        
-        # Enrich
-        entry_data.venue_name = room.name
-        entry_data.venue_address = f"{room.address}" + (f", {room.city}" if room.city else "")
-        entry_data.cabin_number = cabin.number
-        
-        # Calculate Priority (simulated for now, or actual count)
-        if entry.status == WaitlistStatus.ACTIVE:
-             # Count entries for this cabin created before this entry
-            position_query = select(func.count()).select_from(WaitlistEntry).where(
-                WaitlistEntry.cabin_id == entry.cabin_id,
-                WaitlistEntry.status.in_([WaitlistStatus.ACTIVE, WaitlistStatus.NOTIFIED]),
-                WaitlistEntry.created_at < entry.created_at
-            )
-            pos_result = await db.execute(position_query)
-            # Position is count + 1
-            entry_data.priority_position = pos_result.scalar() + 1
-        
-        response.append(entry_data)
+    for entry, room, cabin, position in rows:
+        response.append(_waitlist_response(
+            entry,
+            venue_name=room.name,
+            venue_address=f"{room.address}" + (f", {room.city}" if room.city else ""),
+            cabin_number=cabin.number,
+            # Priority only means something while still waiting
+            priority_position=position if entry.status == WaitlistStatus.ACTIVE else None
+        ))
         
     return response
 
@@ -124,7 +150,6 @@ async def get_venue_waitlist(
     current_user: User = Depends(get_current_user)
 ):
     # Verify ownership of the venue
-    from app.models.reading_room import ReadingRoom
     r_result = await db.execute(select(ReadingRoom).where(ReadingRoom.id == venue_id))
     venue = r_result.scalars().first()
     if not venue:
@@ -141,7 +166,7 @@ async def get_venue_waitlist(
         .join(Cabin, WaitlistEntry.cabin_id == Cabin.id)
         .where(
             WaitlistEntry.reading_room_id == venue_id,
-            WaitlistEntry.status.in_([WaitlistStatus.ACTIVE, WaitlistStatus.NOTIFIED])
+            WaitlistEntry.status.in_(OPEN_WAITLIST_STATUSES)
         )
         .order_by(WaitlistEntry.created_at.asc()) # FIFO order
     )
@@ -151,47 +176,59 @@ async def get_venue_waitlist(
     
     response = []
     for entry, user, cabin in rows:
-        # Convert to Pydantic model
-        entry_data = WaitlistEntryResponse.model_validate(entry)
-        
         # Enrich with User and Cabin details
-        entry_data.user_name = user.name
-        entry_data.user_email = user.email
-        entry_data.cabin_number = cabin.number
-        
-        response.append(entry_data)
+        response.append(_waitlist_response(
+            entry,
+            user_name=user.name,
+            user_email=user.email,
+            cabin_number=cabin.number
+        ))
 
     return response
 
 @router.post("/{entry_id}/cancel")
 async def cancel_waitlist(
     entry_id: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    result = await db.execute(select(WaitlistEntry).where(WaitlistEntry.id == entry_id))
-    entry = result.scalars().first()
-    if not entry:
-        raise HTTPException(status_code=404, detail="Waitlist entry not found")
-        
-    if entry.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized")
-        
-    entry.status = WaitlistStatus.CANCELLED
+    # Release the cabin only if this entry was NOTIFIED and the user still holds it.
+    # Runs before the cancel so the entry's previous status is still visible; the
+    # held_by_user_id guard stops it from clobbering a hold already passed on.
+    notified_cabin = select(WaitlistEntry.cabin_id).where(
+        WaitlistEntry.id == entry_id,
+        WaitlistEntry.user_id == current_user.id,
+        WaitlistEntry.status == WaitlistStatus.NOTIFIED
+    ).scalar_subquery()
+    released_cabin_id = await db.scalar(
+        update(Cabin)
+        .where(Cabin.id == notified_cabin, Cabin.held_by_user_id == current_user.id)
+        .values(status=CabinStatus.AVAILABLE, held_by_user_id=None, hold_expires_at=None)
+        .returning(Cabin.id)
+        .execution_options(synchronize_session=False)
+    )
     
-    # If user was NOTIFIED and holding the cabin, release the hold!
-    if entry.status == WaitlistStatus.NOTIFIED:
-        # Import service to trigger next person
-        from app.services.waitlist_service import waitlist_service
-        # Check if cabin is still held by this user
-        c_result = await db.execute(select(Cabin).where(Cabin.id == entry.cabin_id))
-        cabin = c_result.scalars().first()
-        if cabin and cabin.held_by_user_id == current_user.id:
-            cabin.status = CabinStatus.AVAILABLE # Reset to available first
-            cabin.held_by_user_id = None
-            await db.commit()
-            # Trigger next person immediately
-            await waitlist_service.check_waitlist_and_notify(cabin.id, db)
+    # Ownership check and status change in one statement
+    cancelled_id = await db.scalar(
+        update(WaitlistEntry)
+        .where(WaitlistEntry.id == entry_id, WaitlistEntry.user_id == current_user.id)
+        .values(status=WaitlistStatus.CANCELLED)
+        .returning(WaitlistEntry.id)
+        .execution_options(synchronize_session=False)
+    )
+    if cancelled_id is None:
+        await db.rollback()
+        exists = await db.scalar(select(WaitlistEntry.id).where(WaitlistEntry.id == entry_id))
+        if not exists:
+            raise HTTPException(status_code=404, detail="Waitlist entry not found")
+        raise HTTPException(status_code=403, detail="Not authorized")
     
+    # Cancellation and hold release go out in one commit
     await db.commit()
+    
+    # Offer the cabin to the next person after the response is sent
+    if released_cabin_id:
+        background_tasks.add_task(notify_next_in_waitlist, released_cabin_id)
+    
     return {"message": "Waitlist entry cancelled"}
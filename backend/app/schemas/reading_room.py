@@ -1,4 +1,4 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, HttpUrl, TypeAdapter, ValidationError, field_validator
 from typing import List, Optional, Union
 from datetime import datetime
 import json
@@ -57,6 +57,33 @@ class CabinResponse(CabinBase):
     class Config:
         from_attributes = True
 
+_image_url = TypeAdapter(HttpUrl)
+
+def validate_image_url(url):
+    """Reject anything that is not an http(s) URL or an inline image data URI"""
+    # The venue editor uploads photos as base64 data URIs, so those stay valid
+    if isinstance(url, str) and url.startswith("data:image/"):
+        return url
+    try:
+        _image_url.validate_python(url)
+    except ValidationError:
+        raise ValueError(f"Invalid image URL: {str(url)[:100]}")
+    return url
+
+def normalize_images(v):
+    """Accept a list or a JSON-encoded list string; always hand the model a list of image URLs"""
+    if isinstance(v, str):
+        if not v.strip():
+            return []
+        try:
+            parsed = json.loads(v)
+        except ValueError:
+            parsed = [v]
+        v = parsed if isinstance(parsed, list) else [parsed]
+    if v is None:
+        return v
+    return [validate_image_url(url) for url in v]
+
 class ReadingRoomBase(BaseModel):
     name: str
     address: str
@@ -86,9 +113,7 @@ class ReadingRoomCreate(ReadingRoomBase):
     @field_validator('images')
     @classmethod
     def validate_images(cls, v):
-        if isinstance(v, list):
-            return json.dumps(v)
-        return v
+        return normalize_images(v)
 
 class ReadingRoomUpdate(BaseModel):
     name: Optional[str] = None
@@ -118,9 +143,7 @@ class ReadingRoomUpdate(BaseModel):
     @field_validator('images')
     @classmethod
     def validate_images(cls, v):
-        if isinstance(v, list):
-            return json.dumps(v)
-        return v
+        return normalize_images(v)
 
 class ReadingRoomResponse(ReadingRoomBase):
     id: str
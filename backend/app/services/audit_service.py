@@ -0,0 +1,91 @@
+"""
+Audit Log Writer
+Audit entries don't have to be durable before the HTTP response goes out, so
+routers enqueue them and a background task writes them in batches: one
+executemany INSERT per batch instead of a row per request.
+"""
+import asyncio
+import logging
+from typing import List, Optional
+
+from sqlalchemy import insert
+
+from app.database import AsyncSessionLocal
+from app.models.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_INTERVAL = 0.05  # seconds a batch may wait for more entries
+
+_queue: asyncio.Queue = asyncio.Queue()
+_flusher: Optional[asyncio.Task] = None
+_STOP = object()  # queued by stop_audit_flusher to end the writer loop
+
+
+def enqueue_audit(entry: dict) -> None:
+    """Queue an audit row (AuditLog column -> value) for the background writer"""
+    _queue.put_nowait(entry)
+
+
+async def _write_batch(batch: List[dict]) -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(AuditLog), batch)
+            await session.commit()
+    except Exception:
+        logger.exception("Failed to write %d audit log entries", len(batch))
+
+
+async def _collect_batch(batch: List[dict]) -> bool:
+    """
+    Wait for one entry, then take whatever else arrives within the flush window.
+    Returns False once the stop marker has been taken off the queue.
+    """
+    loop = asyncio.get_running_loop()
+    item = await _queue.get()
+    if item is _STOP:
+        return False
+    batch.append(item)
+    deadline = loop.time() + AUDIT_FLUSH_INTERVAL
+    while len(batch) < AUDIT_BATCH_SIZE:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            item = await asyncio.wait_for(_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            break
+        if item is _STOP:
+            return False
+        batch.append(item)
+    return True
+
+
+async def audit_flusher() -> None:
+    """Long-running task: write queued audit entries in batches until stopped"""
+    running = True
+    while running:
+        batch: List[dict] = []
+        running = await _collect_batch(batch)
+        if batch:
+            await _write_batch(batch)
+
+
+def start_audit_flusher() -> None:
+    global _flusher
+    if _flusher is None or _flusher.done():
+        _flusher = asyncio.create_task(audit_flusher())
+
+
+async def stop_audit_flusher() -> None:
+    """
+    Stop the writer without cancelling it mid-write: the stop marker queues
+    behind pending entries, so everything enqueued before shutdown is written.
+    """
+    global _flusher
+    if _flusher is None:
+        return
+    _queue.put_nowait(_STOP)
+    await _flusher
+    _flusher = None
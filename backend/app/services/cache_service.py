@@ -0,0 +1,54 @@
+"""
+Cache Service - Thin async Redis wrapper
+Redis is optional: when REDIS_URL is not configured or the server is
+unreachable, every call behaves like a cache miss so callers fall back to the DB.
+"""
+
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+
+class CacheService:
+    def __init__(self):
+        self.client = None
+        if settings.REDIS_URL:
+            try:
+                self.client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            except Exception as e:
+                print(f"⚠️  Redis initialization failed: {e}. Caching disabled.")
+                self.client = None
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on miss/error"""
+        if not self.client:
+            return None
+        try:
+            return await self.client.get(key)
+        except Exception as e:
+            print(f"Cache GET failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: str, ttl: int = 300) -> None:
+        """Store value under key with a TTL in seconds"""
+        if not self.client:
+            return
+        try:
+            await self.client.set(key, value, ex=ttl)
+        except Exception as e:
+            print(f"Cache SET failed for {key}: {e}")
+
+    async def delete(self, *keys: str) -> None:
+        """Invalidate one or more keys"""
+        if not self.client or not keys:
+            return
+        try:
+            await self.client.delete(*keys)
+        except Exception as e:
+            print(f"Cache DEL failed for {keys}: {e}")
+
+
+# Create singleton instance
+cache_service = CacheService()
@@ -112,6 +112,42 @@ async def send_booking_extension_email(
         return False
 
 
+async def send_refund_processed_email(
+    recipient_email: EmailStr,
+    recipient_name: str,
+    refund_details: dict
+):
+    """
+    Send refund processed notification to user
+    
+    Args:
+        recipient_email: User's email address
+        recipient_name: User's name
+        refund_details: Dictionary containing:
+            - booking_id: Refunded booking ID
+            - refund_id: Gateway refund ID
+            - amount: Refunded amount (rupees)
+            - reason: Refund reason
+    """
+    try:
+        html_content = f"""
+        <h2>Refund Processed</h2>
+        <p>Dear {recipient_name},</p>
+        <p>A refund has been issued for your booking.</p>
+        <ul>
+            <li><strong>Booking ID:</strong> {refund_details.get('booking_id')}</li>
+            <li><strong>Refund ID:</strong> {refund_details.get('refund_id')}</li>
+            <li><strong>Amount:</strong> ₹{refund_details.get('amount')}</li>
+            <li><strong>Reason:</strong> {refund_details.get('reason')}</li>
+        </ul>
+        <p>It may take 5-7 business days to reflect in your account.</p>
+        """
+        return await _send_email(recipient_email, "Refund Processed - StudySpace", html_content)
+    except Exception as e:
+        print(f"Failed to send refund processed email: {e}")
+        return False
+
+
 async def send_inquiry_response_email(
     recipient_email: EmailStr,
     recipient_name: str,
@@ -13,6 +13,7 @@ from sqlalchemy import and_
 
 from app.models.otp import OTP, PasswordReset
 from app.models.user import User
+from app.deps import invalidate_cached_user
 from app.services.email_service import send_otp_email, send_password_reset_email
 
 
@@ -244,6 +245,7 @@ async def reset_password_with_otp(
     otp.is_verified = True  # Mark as used
     
     await db.commit()
+    invalidate_cached_user(user.id)
     
     print(f"✅ Password reset successful for {email}")
     
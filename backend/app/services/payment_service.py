@@ -4,12 +4,17 @@ import hashlib
 from typing import Dict, Any, Optional
 from fastapi import HTTPException
 import os
-from datetime import datetime
+import time
+
+# HMAC-SHA256 hex digest length
+SIGNATURE_HEX_LENGTH = 64
 
 class PaymentService:
     def __init__(self):
         self.razorpay_key_id = os.getenv("RAZORPAY_KEY_ID", "")
         self.razorpay_key_secret = os.getenv("RAZORPAY_KEY_SECRET", "")
+        # Encode the HMAC key once instead of on every verification
+        self._secret_bytes = self.razorpay_key_secret.encode()
         self.demo_mode = os.getenv("PAYMENT_DEMO_MODE", "false").lower() == "true"
         
         if not self.razorpay_key_id or not self.razorpay_key_secret or self.demo_mode:
@@ -44,7 +49,7 @@ class PaymentService:
         if not self.client or self.demo_mode:
             print(f"💳 Creating DEMO order: ₹{amount}")
             return {
-                "id": f"order_demo_{int(datetime.utcnow().timestamp())}_{int(amount)}",
+                "id": f"order_demo_{int(time.time())}_{int(amount)}",
                 "entity": "order",
                 "amount": amount_in_paise,
                 "amount_paid": 0,
@@ -53,7 +58,7 @@ class PaymentService:
                 "receipt": receipt or f"receipt_demo_{int(amount)}",
                 "status": "created",
                 "notes": notes or {},
-                "created_at": int(datetime.utcnow().timestamp())
+                "created_at": int(time.time())
             }
         
         try:
@@ -71,7 +76,7 @@ class PaymentService:
             # Fallback to demo mode on connection errors
             print(f"⚠️  Razorpay connection failed: {e}. Using demo order.")
             return {
-                "id": f"order_fallback_{int(datetime.utcnow().timestamp())}_{int(amount)}",
+                "id": f"order_fallback_{int(time.time())}_{int(amount)}",
                 "entity": "order",
                 "amount": amount_in_paise,
                 "amount_paid": 0,
@@ -80,7 +85,7 @@ class PaymentService:
                 "receipt": receipt or f"receipt_fallback_{int(amount)}",
                 "status": "created",
                 "notes": notes or {},
-                "created_at": int(datetime.utcnow().timestamp())
+                "created_at": int(time.time())
             }
     
     def verify_payment_signature(self, razorpay_order_id: str, razorpay_payment_id: str, razorpay_signature: str) -> bool:
@@ -100,18 +105,24 @@ class PaymentService:
             print(f"💳 AUTO-VERIFYING demo payment: {razorpay_order_id}")
             return True
         
+        # Razorpay signatures are hex-encoded SHA256 digests; reject malformed
+        # input before doing any hashing work
+        if not razorpay_signature or len(razorpay_signature) != SIGNATURE_HEX_LENGTH:
+            return False
+        
+        try:
+            received_digest = bytes.fromhex(razorpay_signature)
+        except ValueError:
+            return False
+        
         try:
             # Create signature string
-            message = f"{razorpay_order_id}|{razorpay_payment_id}"
+            message = f"{razorpay_order_id}|{razorpay_payment_id}".encode()
             
-            # Generate signature
-            generated_signature = hmac.new(
-                self.razorpay_key_secret.encode(),
-                message.encode(),
-                hashlib.sha256
-            ).hexdigest()
+            # Generate raw digest and compare in constant time
+            generated_digest = hmac.new(self._secret_bytes, message, hashlib.sha256).digest()
             
-            return hmac.compare_digest(generated_signature, razorpay_signature)
+            return hmac.compare_digest(generated_digest, received_digest)
         
         except Exception as e:
             print(f"Error verifying signature: {str(e)}")
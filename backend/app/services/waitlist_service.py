@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal
 from sqlalchemy.future import select
 from app.models.waitlist import WaitlistEntry, WaitlistStatus, Notification
 from app.models.reading_room import Cabin, CabinStatus
@@ -70,3 +71,12 @@ class WaitlistService:
                  await db.commit()
 
 waitlist_service = WaitlistService()
+
+
+async def notify_next_in_waitlist(cabin_id: str):
+    """Offer a freed cabin to the next person waiting (background task, own session)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            await waitlist_service.check_waitlist_and_notify(cabin_id, db)
+    except Exception as e:
+        print(f"Failed to process waitlist for cabin {cabin_id}: {e}")
@@ -0,0 +1,32 @@
+"""
+In-process cache of city activation settings
+CitySettings is tiny and rarely changes, so the {city_name_lower: is_active}
+map is kept for a short TTL and dropped whenever an admin updates a city.
+"""
+import time
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.city import CitySettings
+
+CITY_CACHE_TTL = 30  # seconds
+
+_cache = {"data": None, "exp": 0.0}
+
+
+async def get_city_map(db: AsyncSession) -> Dict[str, bool]:
+    """Return {lowercased city name: is_active}, loading from DB when stale"""
+    if _cache["data"] is not None and time.monotonic() < _cache["exp"]:
+        return _cache["data"]
+
+    result = await db.execute(select(CitySettings.city_name, CitySettings.is_active))
+    data = {name.lower(): is_active for name, is_active in result.all()}
+    _cache.update(data=data, exp=time.monotonic() + CITY_CACHE_TTL)
+    return data
+
+
+def invalidate() -> None:
+    """Drop the cached map; call after any CitySettings write"""
+    _cache.update(data=None, exp=0.0)
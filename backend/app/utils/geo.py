@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great circle distance between two points 
@@ -20,6 +22,31 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     r = 6371 # Radius of earth in kilometers. Use 3956 for miles
     return c * r
 
+def haversine_vec(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Vectorized haversine: distance in Kilometers from (lat0, lon0)
+    to every (lats[i], lons[i]) pair, in one NumPy pass
+    """
+    lat0, lon0 = math.radians(lat0), math.radians(lon0)
+    lats, lons = np.radians(lats), np.radians(lons)
+
+    a = np.sin((lats - lat0) / 2) ** 2 + math.cos(lat0) * np.cos(lats) * np.sin((lons - lon0) / 2) ** 2
+    return 2 * 6371 * np.arcsin(np.sqrt(a))
+
+KM_PER_DEGREE_LAT = 111.0
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> tuple:
+    """
+    Approximate lat/long box that contains every point within radius_km
+    of (lat, lon). Used as a cheap SQL prefilter before exact haversine.
+    Returns (min_lat, max_lat, min_lon, max_lon)
+    """
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    # Longitude degrees shrink with latitude; clamp near the poles
+    cos_lat = max(math.cos(math.radians(lat)), 0.01)
+    dlon = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    return lat - dlat, lat + dlat, lon - dlon, lon + dlon
+
 def sort_by_proximity(user_lat: float, user_lon: float, items: list) -> list:
     """
     Sorts a list of objects (dicts or models) by distance to user.
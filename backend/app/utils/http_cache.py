@@ -0,0 +1,28 @@
+"""
+HTTP caching helpers
+Lets browsers / a CDN reuse GET responses: Cache-Control headers plus a
+content-hash ETag that turns repeat requests into empty 304s.
+"""
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+PUBLIC_SHORT = "public, max-age=30, stale-while-revalidate=60"
+PRIVATE_SHORT = "private, max-age=30"
+
+
+def compute_etag(payload: Any) -> str:
+    """Weak ETag over the JSON form of a response payload"""
+    body = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(",", ":"))
+    return f'W/"{hashlib.sha1(body.encode()).hexdigest()}"'
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Optional[Response]:
+    """Return a 304 when the client's If-None-Match already matches etag, else None"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    return None
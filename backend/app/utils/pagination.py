@@ -0,0 +1,40 @@
+"""
+Keyset (cursor) pagination helpers
+A cursor is the urlsafe-base64 of "<created_at ISO>|<id>" for the last row of a page.
+"""
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Build an opaque cursor pointing at (created_at, id)"""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor back into (created_at, id); 400 on malformed input"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def next_cursor(rows: list, limit: int, created_attr: str = "created_at") -> Optional[str]:
+    """
+    Given rows fetched with LIMIT limit+1, return the cursor for the next page
+    (or None when this is the last page). Trims the extra row in place.
+    """
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    last = rows[-1]
+    return encode_cursor(getattr(last, created_attr), last.id)
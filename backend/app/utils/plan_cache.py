@@ -0,0 +1,32 @@
+"""
+In-process cache of subscription plans by id
+Plans are few and rarely edited, but every venue payment call needs one, so
+plan_id -> plan is memoized and dropped whenever a plan is written.
+"""
+from typing import Optional
+
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.subscription_plan import SubscriptionPlan
+
+PLAN_BY_ID_CACHE_TTL = 300  # seconds
+
+_plan_cache: TTLCache = TTLCache(maxsize=256, ttl=PLAN_BY_ID_CACHE_TTL)
+
+
+async def get_plan(db: AsyncSession, plan_id: str) -> Optional[SubscriptionPlan]:
+    """Subscription plan by id (detached, read-only); None if it doesn't exist"""
+    plan = _plan_cache.get(plan_id)
+    if plan is None:
+        plan = await db.get(SubscriptionPlan, plan_id)
+        if plan is not None:
+            # Shared across requests, so keep it out of this request's session
+            db.expunge(plan)
+            _plan_cache[plan_id] = plan
+    return plan
+
+
+def invalidate_plans() -> None:
+    """Drop all cached plans; call after any SubscriptionPlan write"""
+    _plan_cache.clear()
@@ -0,0 +1,40 @@
+"""
+In-process cache of venue display names
+Trust flags only need a venue's name, which rarely changes, so
+(entity_type, entity_id) -> name is memoized and dropped when the venue
+is updated or deleted.
+"""
+from typing import Optional
+
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.accommodation import Accommodation
+from app.models.reading_room import ReadingRoom
+
+VENUE_NAME_CACHE_TTL = 300  # seconds
+
+VENUE_MODELS = {"reading_room": ReadingRoom, "accommodation": Accommodation}
+
+_name_cache: TTLCache = TTLCache(maxsize=10_000, ttl=VENUE_NAME_CACHE_TTL)
+
+
+async def get_venue_name(db: AsyncSession, entity_type: str, entity_id: str) -> Optional[str]:
+    """Venue name for a reading room / accommodation id; None if it doesn't exist"""
+    model = VENUE_MODELS.get(entity_type)
+    if model is None:
+        return None
+
+    key = (entity_type, entity_id)
+    name = _name_cache.get(key)
+    if name is None:
+        name = await db.scalar(select(model.name).where(model.id == entity_id))
+        if name is not None:
+            _name_cache[key] = name
+    return name
+
+
+def invalidate_venue_name(entity_type: str, entity_id: str) -> None:
+    """Drop a cached name; call after a venue is renamed or deleted"""
+    _name_cache.pop((entity_type, entity_id), None)
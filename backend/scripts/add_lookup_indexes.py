@@ -0,0 +1,84 @@
+"""Add composite / partial indexes for review eligibility, venue, plan, trust and waitlist lookups"""
+import asyncio
+import sys
+from sqlalchemy import text
+
+# The unique partial indexes below can't be built while duplicates exist:
+# keep the newest open flag / pending reminder and close the rest first
+DEDUPLICATE = [
+    ("close duplicate open trust flags", """
+        UPDATE trust_flags
+        SET status = 'RESOLVED', resolved_at = CURRENT_TIMESTAMP,
+            resolution_notes = COALESCE(resolution_notes, 'Closed as a duplicate of a newer open flag')
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (PARTITION BY entity_id ORDER BY created_at DESC, id DESC) AS rn
+                FROM trust_flags WHERE status IN ('ACTIVE', 'OWNER_RESUBMITTED')
+            ) ranked WHERE rn > 1
+        )
+    """),
+    ("expire duplicate pending reminders", """
+        UPDATE reminders SET status = 'EXPIRED'
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (PARTITION BY user_id, reminder_type ORDER BY sent_at DESC, id DESC) AS rn
+                FROM reminders WHERE status = 'PENDING'
+            ) ranked WHERE rn > 1
+        )
+    """),
+]
+
+INDEXES = [
+    ("ix_bookings_user_status_start", "CREATE INDEX IF NOT EXISTS ix_bookings_user_status_start ON bookings (user_id, status, start_date)"),
+    ("ix_bookings_confirmed_user_start", "CREATE INDEX IF NOT EXISTS ix_bookings_confirmed_user_start ON bookings (user_id, start_date) WHERE status IN ('ACTIVE', 'EXPIRED')"),
+    ("ix_cabins_reading_room", "CREATE INDEX IF NOT EXISTS ix_cabins_reading_room ON cabins (reading_room_id)"),
+    ("ix_reviews_reading_room_created", "CREATE INDEX IF NOT EXISTS ix_reviews_reading_room_created ON reviews (reading_room_id, created_at, id)"),
+    ("ix_reviews_accommodation_created", "CREATE INDEX IF NOT EXISTS ix_reviews_accommodation_created ON reviews (accommodation_id, created_at, id)"),
+    # Superseded by the composite indexes above
+    ("drop ix_reviews_reading_room", "DROP INDEX IF EXISTS ix_reviews_reading_room"),
+    ("drop ix_reviews_accommodation", "DROP INDEX IF EXISTS ix_reviews_accommodation"),
+    # Unique while open: duplicate flags / pending reminders are rejected by the INSERT
+    ("uq_trust_flags_open_entity", "CREATE UNIQUE INDEX IF NOT EXISTS uq_trust_flags_open_entity ON trust_flags (entity_id) WHERE status IN ('ACTIVE', 'OWNER_RESUBMITTED')"),
+    ("uq_reminders_pending_user_type", "CREATE UNIQUE INDEX IF NOT EXISTS uq_reminders_pending_user_type ON reminders (user_id, reminder_type) WHERE status = 'PENDING'"),
+    # Trust & safety filters
+    ("ix_trust_flags_entity_status", "CREATE INDEX IF NOT EXISTS ix_trust_flags_entity_status ON trust_flags (entity_id, status)"),
+    ("ix_trust_flags_status_created", "CREATE INDEX IF NOT EXISTS ix_trust_flags_status_created ON trust_flags (status, created_at)"),
+    ("ix_reminders_user_status", "CREATE INDEX IF NOT EXISTS ix_reminders_user_status ON reminders (user_id, status)"),
+    ("ix_audit_logs_timestamp", "CREATE INDEX IF NOT EXISTS ix_audit_logs_timestamp ON audit_logs (timestamp)"),
+    ("ix_audit_logs_entity", "CREATE INDEX IF NOT EXISTS ix_audit_logs_entity ON audit_logs (entity_type, entity_id, timestamp)"),
+    ("ix_reading_rooms_owner", "CREATE INDEX IF NOT EXISTS ix_reading_rooms_owner ON reading_rooms (owner_id)"),
+    ("ix_accommodations_owner", "CREATE INDEX IF NOT EXISTS ix_accommodations_owner ON accommodations (owner_id)"),
+    # Waitlist queues
+    ("ix_waitlist_cabin_status_created", "CREATE INDEX IF NOT EXISTS ix_waitlist_cabin_status_created ON waitlist (cabin_id, status, created_at)"),
+    ("ix_waitlist_user_cabin_status", "CREATE INDEX IF NOT EXISTS ix_waitlist_user_cabin_status ON waitlist (user_id, cabin_id, status)"),
+    ("ix_waitlist_rr_status_created", "CREATE INDEX IF NOT EXISTS ix_waitlist_rr_status_created ON waitlist (reading_room_id, status, created_at)"),
+    ("ix_subplans_active_price", "CREATE INDEX IF NOT EXISTS ix_subplans_active_price ON subscription_plans (price) WHERE is_active = true"),
+]
+
+async def migrate() -> bool:
+    """Returns False if a unique index could not be created"""
+    from app.database import engine
+    
+    for name, sql in DEDUPLICATE:
+        async with engine.begin() as conn:
+            result = await conn.execute(text(sql))
+            print(f"✅ {name}: {result.rowcount} rows")
+    
+    # One transaction per statement: on Postgres a failed DDL would otherwise
+    # abort the transaction and take every later index down with it
+    ok = True
+    for name, ddl in INDEXES:
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(ddl))
+            print(f"✅ Created {name}")
+        except Exception as e:
+            print(f"⚠️ {name}: {e}")
+            # create_flag / send_reminder rely on these for duplicate protection
+            if name.startswith("uq_"):
+                ok = False
+    return ok
+
+if __name__ == "__main__":
+    if not asyncio.run(migrate()):
+        sys.exit("❌ A unique index could not be created; duplicate protection is missing")
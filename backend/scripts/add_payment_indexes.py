@@ -0,0 +1,23 @@
+"""Add composite indexes for payment / refund history lookups"""
+import asyncio
+from sqlalchemy import text
+
+INDEXES = [
+    ("ix_pt_user_created", "CREATE INDEX IF NOT EXISTS ix_pt_user_created ON payment_transactions (user_id, created_at DESC)"),
+    ("ix_pt_booking_created", "CREATE INDEX IF NOT EXISTS ix_pt_booking_created ON payment_transactions (booking_id, created_at DESC)"),
+    ("ix_refund_user_requested", "CREATE INDEX IF NOT EXISTS ix_refund_user_requested ON refunds (user_id, requested_at DESC)"),
+]
+
+async def migrate():
+    from app.database import engine
+    
+    async with engine.begin() as conn:
+        for name, ddl in INDEXES:
+            try:
+                await conn.execute(text(ddl))
+                print(f"✅ Created {name}")
+            except Exception as e:
+                print(f"⚠️ {name}: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
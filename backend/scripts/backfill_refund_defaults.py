@@ -0,0 +1,30 @@
+"""Backfill NULL reason/status/requested_at on refunds so the columns can be NOT NULL"""
+import asyncio
+from sqlalchemy import text
+
+async def migrate():
+    from app.database import engine
+    
+    async with engine.begin() as conn:
+        result = await conn.execute(text("UPDATE refunds SET reason = 'OTHER' WHERE reason IS NULL"))
+        print(f"✅ Backfilled reason on {result.rowcount} refunds")
+        
+        result = await conn.execute(text("UPDATE refunds SET status = 'REQUESTED' WHERE status IS NULL"))
+        print(f"✅ Backfilled status on {result.rowcount} refunds")
+        
+        result = await conn.execute(text("UPDATE refunds SET requested_at = CURRENT_TIMESTAMP WHERE requested_at IS NULL"))
+        print(f"✅ Backfilled requested_at on {result.rowcount} refunds")
+    
+    # Tighten constraints (Postgres only - SQLite cannot ALTER COLUMN)
+    if engine.dialect.name == "postgresql":
+        async with engine.begin() as conn:
+            for column, default in (("reason", "'OTHER'"), ("status", "'REQUESTED'"), ("requested_at", "now()")):
+                try:
+                    await conn.execute(text(f"ALTER TABLE refunds ALTER COLUMN {column} SET DEFAULT {default}"))
+                    await conn.execute(text(f"ALTER TABLE refunds ALTER COLUMN {column} SET NOT NULL"))
+                    print(f"✅ {column} is now NOT NULL")
+                except Exception as e:
+                    print(f"⚠️ {column}: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
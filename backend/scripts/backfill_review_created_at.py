@@ -0,0 +1,23 @@
+"""Backfill NULL created_at on reviews so the column can be NOT NULL (it is the listing cursor)"""
+import asyncio
+from sqlalchemy import text
+
+async def migrate():
+    from app.database import engine
+    
+    async with engine.begin() as conn:
+        result = await conn.execute(text("UPDATE reviews SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL"))
+        print(f"✅ Backfilled created_at on {result.rowcount} reviews")
+    
+    # Tighten constraints (Postgres only - SQLite cannot ALTER COLUMN)
+    if engine.dialect.name == "postgresql":
+        async with engine.begin() as conn:
+            try:
+                await conn.execute(text("ALTER TABLE reviews ALTER COLUMN created_at SET DEFAULT now()"))
+                await conn.execute(text("ALTER TABLE reviews ALTER COLUMN created_at SET NOT NULL"))
+                print("✅ created_at is now NOT NULL")
+            except Exception as e:
+                print(f"⚠️ created_at: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,38 @@
+import asyncio
+import os
+import sys
+
+# Add backend directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.database import engine
+from sqlalchemy import text
+
+async def migrate():
+    if engine.dialect.name != "postgresql":
+        print("Not PostgreSQL - audit_logs.extra_data stays a JSON column, nothing to do.")
+        return
+
+    async with engine.begin() as conn:
+        data_type = await conn.scalar(text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'audit_logs' AND column_name = 'extra_data'"
+        ))
+        if data_type is None:
+            print("audit_logs.extra_data not found - create_all will add it as JSONB.")
+        elif data_type == "jsonb":
+            print("audit_logs.extra_data is already JSONB.")
+        else:
+            print(f"Converting audit_logs.extra_data from {data_type} to JSONB...")
+            # Existing rows hold json.dumps() output, so a direct cast parses them
+            await conn.execute(text(
+                "ALTER TABLE audit_logs ALTER COLUMN extra_data TYPE JSONB USING extra_data::jsonb"
+            ))
+            print("Converted audit_logs.extra_data to JSONB.")
+
+    print("Migration complete.")
+
+if __name__ == "__main__":
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(migrate())
@@ -0,0 +1,39 @@
+import asyncio
+import os
+import sys
+
+# Add backend directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.database import engine
+from sqlalchemy import text
+
+async def migrate():
+    if engine.dialect.name != "postgresql":
+        print("Not PostgreSQL - reading_rooms.payment_date needs no conversion.")
+        return
+
+    async with engine.begin() as conn:
+        data_type = await conn.scalar(text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'reading_rooms' AND column_name = 'payment_date'"
+        ))
+        if data_type is None:
+            print("reading_rooms.payment_date not found - create_all will add it.")
+        elif data_type == "timestamp with time zone":
+            print("reading_rooms.payment_date is already TIMESTAMPTZ.")
+        else:
+            print(f"Converting reading_rooms.payment_date from {data_type} to TIMESTAMPTZ...")
+            # Existing values were written with datetime.utcnow(), i.e. naive UTC
+            await conn.execute(text(
+                "ALTER TABLE reading_rooms ALTER COLUMN payment_date "
+                "TYPE TIMESTAMPTZ USING payment_date AT TIME ZONE 'UTC'"
+            ))
+            print("Converted reading_rooms.payment_date to TIMESTAMPTZ.")
+
+    print("Migration complete.")
+
+if __name__ == "__main__":
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(migrate())
@@ -0,0 +1,35 @@
+import json
+
+from pydantic import ValidationError
+
+from app.schemas.reading_room import ReadingRoomCreate, ReadingRoomUpdate
+
+ROOM = {"name": "Image Test Room", "address": "1 Test St"}
+PHOTO = "https://cdn.example.com/rooms/1.jpg"
+UPLOAD = "data:image/png;base64,iVBORw0KGgo="
+
+
+def test_accepts_urls_and_uploads():
+    room = ReadingRoomCreate(**ROOM, images=[PHOTO, UPLOAD])
+    assert room.images == [PHOTO, UPLOAD]
+
+
+def test_accepts_json_encoded_list():
+    room = ReadingRoomUpdate(images=json.dumps([PHOTO]))
+    assert room.images == [PHOTO]
+
+
+def test_rejects_non_url():
+    for images in (["not a url"], json.dumps([PHOTO, "ftp://example.com/a.jpg"]), "just-a-name.jpg"):
+        try:
+            ReadingRoomCreate(**ROOM, images=images)
+        except ValidationError:
+            continue
+        raise AssertionError(f"images={images!r} should have been rejected")
+
+
+if __name__ == "__main__":
+    test_accepts_urls_and_uploads()
+    test_accepts_json_encoded_list()
+    test_rejects_non_url()
+    print("✅ PASSED: reading room image URLs are validated")
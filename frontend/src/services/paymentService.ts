@@ -44,6 +44,51 @@ export interface RefundRequestInput {
     reason_text?: string;
 }
 
+export interface OwnerPayment {
+    id: string;
+    booking_id: string;
+    user_id: string;
+    user_name: string;
+    type: 'INITIAL' | 'EXTENSION' | 'REFUND';
+    amount: number;
+    date: string;
+    venue_name: string;
+    cabin_number: string;
+    transaction_id: string;
+    description: string;
+    method: string;
+}
+
+export interface OwnerPaymentHistory {
+    payments: OwnerPayment[];
+    total_count: number;
+    total_amount: number;
+}
+
+const PAGE_SIZE = 200;
+
+/**
+ * Fetch every page of a keyset-paginated list endpoint, following the
+ * X-Next-Cursor header until the last page. `rowsOf` picks the rows out of
+ * one page; the first page's body is returned as well (for totals).
+ */
+async function fetchAllPages<P, T>(
+    url: string,
+    params: Record<string, unknown>,
+    rowsOf: (page: P) => T[]
+): Promise<{ first: P; rows: T[] }> {
+    const rows: T[] = [];
+    let first: P | undefined;
+    let cursor: string | undefined;
+    do {
+        const response = await api.get<P>(url, { params: { ...params, limit: PAGE_SIZE, cursor } });
+        if (first === undefined) first = response.data;
+        rows.push(...rowsOf(response.data));
+        cursor = response.headers['x-next-cursor'];
+    } while (cursor);
+    return { first: first as P, rows };
+}
+
 // API Functions
 export const paymentService = {
     /**
@@ -58,8 +103,8 @@ export const paymentService = {
      * Get all refund requests for the current user
      */
     async getMyRefunds(): Promise<Refund[]> {
-        const response = await api.get<Refund[]>('/user/refunds');
-        return response.data;
+        const { rows } = await fetchAllPages<Refund[], Refund>('/user/refunds', {}, page => page);
+        return rows;
     },
 
     /**
@@ -75,8 +120,8 @@ export const paymentService = {
      */
     async getAllRefunds(statusFilter?: string): Promise<RefundAdmin[]> {
         const params = statusFilter ? { status_filter: statusFilter } : {};
-        const response = await api.get<RefundAdmin[]>('/admin/refunds', { params });
-        return response.data;
+        const { rows } = await fetchAllPages<RefundAdmin[], RefundAdmin>('/admin/refunds', params, page => page);
+        return rows;
     },
 
     /**
@@ -138,26 +183,12 @@ export const paymentService = {
     /**
      * Get all payment transactions for owner's venue (including extensions)
      */
-    async getOwnerPaymentHistory(): Promise<{
-        payments: Array<{
-            id: string;
-            booking_id: string;
-            user_id: string;
-            user_name: string;
-            type: 'INITIAL' | 'EXTENSION' | 'REFUND';
-            amount: number;
-            date: string;
-            venue_name: string;
-            cabin_number: string;
-            transaction_id: string;
-            description: string;
-            method: string;
-        }>;
-        total_count: number;
-        total_amount: number;
-    }> {
-        const response = await api.get('/payments/owner/payment-history');
-        return response.data;
+    async getOwnerPaymentHistory(): Promise<OwnerPaymentHistory> {
+        // Totals on every page cover the whole history; only the rows are paged
+        const { first, rows } = await fetchAllPages<OwnerPaymentHistory, OwnerPayment>(
+            '/payments/owner/payment-history', {}, page => page.payments
+        );
+        return { ...first, payments: rows };
     },
 
     /**
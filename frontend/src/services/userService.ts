@@ -3,12 +3,19 @@ import { User } from '../types';
 
 export const userService = {
     getAllUsers: async (): Promise<User[]> => {
-        const response = await api.get('/users/');
+        // The list is keyset-paginated; follow X-Next-Cursor until the last page
+        const users: any[] = [];
+        let afterId: string | undefined;
+        do {
+            const response = await api.get('/users/', { params: { limit: 200, after_id: afterId } });
+            users.push(...response.data);
+            afterId = response.headers['x-next-cursor'];
+        } while (afterId);
         // Mapping backend response to frontend User type if strictly needed,
         // but typically they match. 
         // Backend UserResponse: id, email, name, role, avatar_url, phone
         // Frontend User: id, name, email, role, avatarUrl, phone...
-        return response.data.map((u: any) => ({
+        return users.map((u: any) => ({
             id: u.id,
             name: u.name,
             email: u.email,
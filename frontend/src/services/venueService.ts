@@ -272,7 +272,14 @@ export const venueService = {
     },
 
     getMyReviews: async (userId: string): Promise<any[]> => {
-        const response = await api.get('/reviews/', { params: { user_id: userId } });
-        return response.data;
+        // Reviews are keyset-paginated; follow X-Next-Cursor until the last page
+        const reviews: any[] = [];
+        let cursor: string | undefined;
+        do {
+            const response = await api.get('/reviews/', { params: { user_id: userId, limit: 100, cursor } });
+            reviews.push(...response.data);
+            cursor = response.headers['x-next-cursor'];
+        } while (cursor);
+        return reviews;
     }
 };